@@ -1,3 +1,13 @@
+from .cache import ComponentCache
+from .cadence import Cadence, detect_cadence
+from .dataset import parse_dataset
+from .errors import ParseError, error_summary
+from .incremental import IncrementalParser, Watermark
+from .index import TimeIndex
 from .parser import Parser
+from .progress import CancellationToken, ParseCancelled
+from .scan import find_date_columns
+from .synthetic import generate_mangled, write_mangled
+from .workbook import parse_workbook
 
-__all__  = ["Parser"]
+__all__  = ["Cadence", "CancellationToken", "ComponentCache", "IncrementalParser", "ParseCancelled", "ParseError", "Parser", "TimeIndex", "Watermark", "detect_cadence", "error_summary", "find_date_columns", "generate_mangled", "parse_dataset", "parse_workbook", "write_mangled"]
@@ -0,0 +1,123 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import polars as pl
+
+"""
+A cache for the tokenised components of a date column.
+
+Splitting a column into its components is by far the most expensive part of
+the component pipeline, and it only depends on the column and the separators -
+not on which component we then decide is the day or the month. When a parse
+looks wrong and we try again with `allow_dayfirst`, `allow_monthfirst` etc.
+flipped, there's no need to split the column again: we can pick the components
+up from here and only re-run the mapping and assembly stages.
+
+The cache is bounded by the estimated size of the frames it holds, and evicts
+the least recently used entries first. It is safe to share between threads.
+"""
+
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+
+def column_fingerprint(series : pl.Series) -> str:
+    """
+    A fingerprint of a column's contents (and order), used to recognise it
+    when it comes round again. This hashes the 64 bit hash of every value, so
+    is much cheaper than the split it saves.
+    """
+
+    hashes = series.hash(seed=0).to_numpy()
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(series.dtype).encode())
+    digest.update(hashes.tobytes())
+
+    return digest.hexdigest()
+
+
+class ComponentCache():
+    def __init__(self
+                ,max_bytes : int = DEFAULT_MAX_BYTES
+                ):
+        """
+        Least recently used cache of split component frames, bounded by their
+        estimated size in bytes.
+
+        Parameters
+        ----------
+        `max_bytes` : int, optional
+            The most memory the cached frames may take up. Frames larger than
+            this on their own are never cached. Defaults to 512 MiB.
+        """
+
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key : tuple) -> bool:
+        return key in self._entries
+
+    def get(self
+           ,key : tuple
+           ) -> tuple[pl.DataFrame,Any] | None:
+        """
+        Look up a cached component frame and whatever was stored with it,
+        marking it as recently used. Returns None on a miss.
+        """
+
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            df, extra, _ = self._entries[key]
+
+        return df, extra
+
+    def put(self
+           ,key : tuple
+           ,df : pl.DataFrame
+           ,extra : Any = None
+           ) -> None:
+        """
+        Cache a component frame, along with anything else needed to pick the
+        pipeline back up from it. Evicts the least recently used entries until
+        everything fits.
+        """
+
+        nbytes = df.estimated_size()
+        if nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[2]
+
+            self._entries[key] = (df, extra, nbytes)
+            self.nbytes += nbytes
+
+            while self.nbytes > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+# Shared between parsers, so that differently configured parsers can reuse
+# each other's work. Used when a parser is created with `cache=True`.
+DEFAULT_CACHE = ComponentCache()
@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from pprint import pformat
+
+import polars as pl
+
+from .partition import diff
+
+"""
+Cadence detection for parsed datetime columns.
+
+Once the parser has built its `Datetime` column we already have everything we
+need to work out how regular the series is, so rather than making the user do
+a second pass over the data we compute the inferred frequency, the gaps, the
+duplicated timestamps and the longest regular run from a single `diff()`.
+"""
+
+@dataclass
+class Cadence():
+    """
+    Summary of how regular a datetime column is.
+
+    Attributes
+    ----------
+    `frequency` : timedelta | None
+        The most common positive step between consecutive timestamps. None if
+        the column has fewer than two distinct timestamps.
+    `longest_run_start` : int | None
+        Row position at which the longest run of evenly spaced timestamps
+        starts.
+    `longest_run_length` : int
+        Number of rows in the longest evenly spaced run.
+    `irregularities` : pl.DataFrame
+        One row per timestamp which does not follow on from its predecessor by
+        exactly `frequency`, and one per null timestamp. Columns are `row`, 
+        `Datetime`, `delta`, `kind` (one of "gap", "duplicate", "backward", 
+        "irregular" or "null") and `missing` (the number of steps skipped by a
+        gap). Steps are measured from the last non-null timestamp, so a row 
+        that failed to parse doesn't hide the gap it leaves.
+    """
+    frequency : timedelta | None
+    longest_run_start : int | None
+    longest_run_length : int
+    irregularities : pl.DataFrame
+
+    @property
+    def gaps(self) -> pl.DataFrame:
+        return self.irregularities.filter(pl.col("kind") == "gap")
+
+    @property
+    def duplicates(self) -> pl.DataFrame:
+        return self.irregularities.filter(pl.col("kind") == "duplicate")
+
+    @property
+    def is_regular(self) -> bool:
+        return self.irregularities.height == 0
+
+    def __str__(self):
+        summary = {
+            "frequency": self.frequency,
+            "longest_run_start": self.longest_run_start,
+            "longest_run_length": self.longest_run_length,
+            "gaps": self.gaps.height,
+            "duplicates": self.duplicates.height,
+            "irregularities": self.irregularities.height,
+        }
+        return f"ExcellAint Cadence:\n{pformat(summary,indent=4)}"
+
+
+def detect_cadence(df : pl.DataFrame
+                  ,datetime_col : str = "Datetime"
+                  ,row_col : str | None = None
+                  ,n_partitions : int = 1
+                  ) -> Cadence:
+    """
+    Work out the cadence of a datetime column from the differences between
+    consecutive rows.
+
+    Parameters
+    ----------
+    `df` : pl.DataFrame
+        The DataFrame containing the parsed datetime column.
+    `datetime_col` : str, optional
+        The name of the datetime column. Defaults to "Datetime".
+    `row_col` : str, optional
+        A column holding the row positions to report. If not given, positions
+        are counted from zero in the order the rows appear.
+    `n_partitions` : int, optional
+        The number of row partitions to compute the steps between consecutive
+        timestamps over, in parallel. Defaults to 1.
+
+    Returns
+    -------
+    `Cadence`
+        The inferred frequency, the longest regular run and a side table of
+        every irregular step.
+    """
+
+    if row_col is None:
+        rows = pl.int_range(0, pl.len(), dtype=pl.Int64)
+    else:
+        rows = pl.col(row_col).cast(pl.Int64)
+
+    # Measure each step from the last non-null timestamp, so that a null 
+    # (e.g. a row a lenient parse couldn't read) doesn't swallow the gap.
+    datetimes = df[datetime_col]
+    if datetimes.null_count():
+        valid = datetimes.is_not_null()
+        valid_deltas = diff(datetimes.filter(valid),n_partitions)
+        deltas = (
+            pl.Series([None] * datetimes.len(),dtype=valid_deltas.dtype)
+            .scatter(valid.arg_true(),valid_deltas)
+        )
+    else:
+        deltas = diff(datetimes,n_partitions)
+
+    steps = df.select(
+        rows.alias("row"),
+        pl.col(datetime_col).alias("Datetime"),
+        pl.lit(deltas).alias("delta"),
+    )
+
+    is_null = pl.col("Datetime").is_null()
+
+    frequency = (
+        steps
+        .select(pl.col("delta").filter(pl.col("delta") > timedelta(0)).mode().min())
+        .item()
+    )
+
+    if frequency is None:
+        nulls = steps.filter(is_null).with_columns(
+            pl.lit("null",dtype=pl.Utf8).alias("kind"),
+            pl.lit(0,dtype=pl.Int64).alias("missing"),
+        )
+        return Cadence(None, 0 if steps.height else None, min(steps.height,1), nulls)
+
+    steps = steps.with_columns(
+        (pl.col("delta") == frequency).alias("regular")
+    )
+
+    irregularities = (
+        steps
+        .filter(is_null | (pl.col("delta").is_not_null() & ~pl.col("regular")))
+        .with_columns(
+            pl.when(is_null).then(pl.lit("null"))
+            .when(pl.col("delta") == timedelta(0)).then(pl.lit("duplicate"))
+            .when(pl.col("delta") < timedelta(0)).then(pl.lit("backward"))
+            .when(pl.col("delta") > frequency).then(pl.lit("gap"))
+            .otherwise(pl.lit("irregular"))
+            .alias("kind")
+        )
+        .with_columns(
+            pl.when(pl.col("kind") == "gap")
+            .then(pl.col("delta").dt.total_microseconds()
+                  // (frequency // timedelta(microseconds=1)) - 1)
+            .otherwise(0)
+            .cast(pl.Int64)
+            .alias("missing")
+        )
+        .drop("regular")
+    )
+
+    # A run of k regular steps covers k + 1 rows, starting on the row before
+    # the first regular step.
+    longest = (
+        steps
+        .with_row_index("position")
+        .with_columns(pl.col("regular").fill_null(False).rle_id().alias("run"))
+        .filter(pl.col("regular"))
+        .group_by("run")
+        .agg(
+            pl.col("position").min().alias("start"),
+            pl.len().alias("length"),
+        )
+        .sort(["length","start"],descending=[True,False])
+        .head(1)
+    )
+
+    if longest.height == 0:
+        return Cadence(frequency, steps["row"][0], 1, irregularities)
+
+    start_position = longest["start"][0] - 1
+
+    return Cadence(frequency
+                  ,steps["row"][start_position]
+                  ,longest["length"][0] + 1
+                  ,irregularities)
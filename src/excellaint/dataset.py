@@ -0,0 +1,209 @@
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import polars as pl
+
+from .formats import stratified_sample
+from .parser import Parser
+
+"""
+Parsing a partitioned dataset in one go.
+
+Raw data we have ingested is kept as a directory tree of Parquet or CSV files,
+often hive partitioned (`year=2020/month=01/part-0.parquet`). Parsing each file
+on its own means every file infers its own format, which is slow, and on an
+ambiguous file (one where every day is <= 12, say) can give a different answer
+to its neighbours. `parse_dataset` instead decides on the format once, from a
+sample drawn evenly across every file, and then parses the files in parallel
+with that one decision, writing the results to the same relative paths under an
+output directory.
+
+Files whose output is newer than they are are skipped, so re-running over a
+tree only parses what has changed. Outputs are written to a temporary file and
+renamed into place, so an interrupted run never leaves a half written file
+looking up to date.
+"""
+
+DATASET_SUFFIXES = (".parquet", ".csv")
+
+DATASET_SCHEMA = {
+    "source" : pl.Utf8,
+    "destination" : pl.Utf8,
+    "status" : pl.Utf8,
+    "rows" : pl.Int64,
+}
+
+
+def _find_files(src_dir : Path) -> list[Path]:
+    return sorted(
+        path for path in src_dir.rglob("*")
+        if path.is_file() and path.suffix in DATASET_SUFFIXES
+    )
+
+
+def _scan_file(path : Path
+              ,date_column : str
+              ) -> pl.LazyFrame:
+    if path.suffix == ".parquet":
+        header = pl.read_parquet_schema(path)
+    else:
+        header = pl.read_csv(path,n_rows=0).columns
+
+    if date_column not in header:
+        raise ValueError(f"Column {date_column} not found in {path}")
+
+    # The partition columns stay in the directory names of the mirrored tree,
+    # so there's no need to add them to every file.
+    if path.suffix == ".parquet":
+        return pl.scan_parquet(path,hive_partitioning=False,glob=False)
+
+    # Keep the date column as strings, whatever the CSV reader makes of it
+    return pl.scan_csv(path,schema_overrides={date_column : pl.Utf8},glob=False)
+
+
+def _read_file(path : Path
+              ,date_column : str
+              ) -> pl.DataFrame:
+    return _scan_file(path,date_column).collect()
+
+
+def _sample_file(path : Path
+                ,date_column : str
+                ,n_values : int
+                ) -> pl.Series:
+    """
+    An evenly spaced sample of at most `n_values` from a file's date column. The
+    file is scanned lazily, so only that column is read, and only the sample is
+    kept once it has been.
+    """
+
+    dates = _scan_file(path,date_column).select(date_column)
+    n_rows = dates.select(pl.len()).collect().item()
+
+    return dates.select(pl.col(date_column).gather_every(max(1, -(-n_rows // n_values)))).collect()[date_column]
+
+
+def _write_file(df : pl.DataFrame
+               ,path : Path
+               ) -> None:
+    path.parent.mkdir(parents=True,exist_ok=True)
+
+    # Write then rename, so a crash never leaves a half written output
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        if path.suffix == ".parquet":
+            df.write_parquet(tmp_path)
+        else:
+            df.write_csv(tmp_path)
+        os.replace(tmp_path,path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _up_to_date(src : Path
+               ,dst : Path
+               ) -> bool:
+    return dst.exists() and dst.stat().st_mtime >= src.stat().st_mtime
+
+
+def parse_dataset(src_dir : str | Path
+                 ,dst_dir : str | Path
+                 ,date_column : str
+                 ,parser : Parser | None = None
+                 ,sample_size : int = 1000
+                 ,overwrite : bool = False
+                 ,max_workers : int | None = None
+                 ) -> pl.DataFrame:
+    """
+    Parse the same date column in every Parquet and CSV file under a directory,
+    writing each result to the same relative path under `dst_dir`.
+
+    Parameters
+    ----------
+    `src_dir` : str | Path
+        The root of the dataset to parse.
+    `dst_dir` : str | Path
+        Where to write the parsed dataset. The directory structure of `src_dir`
+        is mirrored here, and each output is in the same format as its input.
+    `date_column` : str
+        The name of the date column, which must be present in every file.
+    `parser` : Parser, optional
+        The parser to use. Defaults to `Parser(mode="datetime")`.
+    `sample_size` : int, optional
+        The number of values, across all the files, used to decide on the date
+        format. Defaults to 1000.
+    `overwrite` : bool, optional
+        If True, parse every file even if its output is already up to date.
+        Defaults to False.
+    `max_workers` : int, optional
+        The number of threads used to read, parse and write the files. Defaults
+        to the `ThreadPoolExecutor` default.
+
+    Returns
+    -------
+    `pl.DataFrame`
+        One row per file, with its `source` and `destination` paths, its
+        `status` ("parsed" or "skipped") and the number of `rows` parsed (null
+        if skipped).
+
+    Raises
+    ------
+    `ValueError`
+        If `src_dir` isn't a directory, or a file doesn't have `date_column`.
+    """
+
+    src_dir = Path(src_dir)
+    dst_dir = Path(dst_dir)
+
+    if not src_dir.is_dir():
+        raise ValueError(f"{src_dir} is not a directory")
+
+    if parser is None:
+        parser = Parser(mode="datetime")
+
+    sources = _find_files(src_dir)
+    destinations = [dst_dir / src.relative_to(src_dir) for src in sources]
+
+    if not sources:
+        return pl.DataFrame(schema=DATASET_SCHEMA)
+
+    stale = [
+        (src, dst) for src, dst in zip(sources,destinations)
+        if overwrite or not _up_to_date(src,dst)
+    ]
+
+    rows = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        if stale:
+            # The format is decided from every file, not just the stale ones, so
+            # that a partial re-run makes the same decision as a full one.
+            per_file = max(1, sample_size // len(sources))
+            pieces = pool.map(lambda src: _sample_file(src,date_column,per_file),sources)
+            sample = stratified_sample(list(pieces),sample_size)
+            locked = parser.lock_format(sample)
+            locked._checkpoint("sample",sample.len(),sample.len())
+
+            def parse_file(paths : tuple[Path,Path]) -> int:
+                src, dst = paths
+                # A copy per file, since parsers record their last run, and so
+                # that progress is reported against the file
+                file_parser = copy.copy(locked)
+                file_parser.piece = str(src)
+                parsed = file_parser(_read_file(src,date_column),date_column)
+                file_parser._checkpoint("write",parsed.height,parsed.height)
+                _write_file(parsed,dst)
+                return parsed.height
+
+            rows = dict(zip((src for src, _ in stale),pool.map(parse_file,stale)))
+
+    return pl.DataFrame(
+        {
+            "source" : [str(src) for src in sources],
+            "destination" : [str(dst) for dst in destinations],
+            "status" : ["parsed" if src in rows else "skipped" for src in sources],
+            "rows" : [rows.get(src) for src in sources],
+        }
+        ,schema=DATASET_SCHEMA
+    )
@@ -0,0 +1,71 @@
+from enum import IntEnum
+
+import polars as pl
+
+"""
+Per-row error codes for lenient parsing.
+
+When the parser is run with `lenient=True`, rows that can't be parsed come back
+as nulls rather than raising for the whole column, and each row gets a small
+integer code saying what went wrong with it. The codes are defined here, along
+with a helper to turn a column of them into a summary.
+"""
+
+ERROR_COL = "excellaint_error"
+
+
+class ParseError(IntEnum):
+    """
+    Reasons a row could not be parsed. `OK` rows parsed cleanly.
+    """
+    OK = 0
+    MISSING = 1
+    BAD_SEPARATOR = 2
+    BAD_COMPONENT = 3
+    BAD_TIME = 4
+    MONTH_OUT_OF_RANGE = 5
+    INVALID_DAY = 6
+    WEEKDAY_MISMATCH = 7
+
+
+def error_summary(df : pl.DataFrame
+                 ,error_col : str = ERROR_COL
+                 ) -> pl.DataFrame:
+    """
+    Aggregate the per-row error codes produced by a lenient parse.
+
+    Parameters
+    ----------
+    `df` : pl.DataFrame
+        The DataFrame returned by a lenient parse.
+    `error_col` : str, optional
+        The name of the error code column. Defaults to "excellaint_error".
+
+    Returns
+    -------
+    `pl.DataFrame`
+        One row per error code that occurs, excluding `OK`, with the name of
+        the error, the number of rows affected and the first row it occurs on.
+    """
+
+    if error_col not in df.columns:
+        raise ValueError(f"Column {error_col} not found in dataframe. Was the parser run with lenient=True?")
+
+    names = {code.value : code.name for code in ParseError}
+
+    return (
+        df
+        .select(pl.col(error_col).alias("code"))
+        .with_row_index("first_row")
+        .filter(pl.col("code") != ParseError.OK)
+        .group_by("code")
+        .agg(
+            pl.len().alias("count"),
+            pl.col("first_row").min(),
+        )
+        .with_columns(
+            pl.col("code").replace(names,return_dtype=pl.Utf8).alias("error")
+        )
+        .select("code","error","count","first_row")
+        .sort("code")
+    )
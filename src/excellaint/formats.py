@@ -0,0 +1,181 @@
+import re
+
+import polars as pl
+
+"""
+Strict format inference.
+
+Plenty of the columns we get handed aren't actually mangled at all - they're
+already in a single, fixed-width format like `2020/01/01 01:00` or ISO 8601. For
+those there's no point splitting every string into components and stitching
+them back together: polars can parse them directly with `str.to_datetime`. The
+functions here work out, from a sample of the column, whether it is in exactly
+one such format, so that the parser can dispatch to that fast path.
+"""
+
+_DIRECTIVE_PATTERNS = {
+    "%Y" : r"\d{4}",
+    "%m" : r"\d{2}",
+    "%d" : r"\d{2}",
+    "%H" : r"\d{2}",
+    "%M" : r"\d{2}",
+    "%S" : r"\d{2}",
+}
+
+ISO_DATE_FORMATS = [
+    "%Y-%m-%d",
+]
+
+ISO_DATETIME_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+]
+
+
+def format_to_regex(fmt : str) -> str:
+    """
+    Convert a strftime style format into a regex which only matches strings
+    in exactly that format, with every component zero padded.
+
+    Parameters
+    ----------
+    `fmt` : str
+        The format to convert, e.g. "%Y/%m/%d %H:%M". Only the directives
+        %Y, %m, %d, %H, %M and %S are supported.
+
+    Returns
+    -------
+    `str`
+        An anchored regex matching the format.
+
+    Raises
+    ------
+    `ValueError`
+        If the format contains a directive we don't support.
+    """
+
+    pattern = ""
+    for token in re.split(r"(%.)",fmt):
+        if token.startswith("%"):
+            if token not in _DIRECTIVE_PATTERNS:
+                raise ValueError(f"Unsupported directive {token} in format {fmt}")
+            pattern += _DIRECTIVE_PATTERNS[token]
+        else:
+            pattern += re.escape(token)
+
+    return f"^{pattern}$"
+
+
+def candidate_formats(mode : str
+                     ,date_sep : str
+                     ,time_sep : str
+                     ,datetime_sep : str
+                     ,allow_yearfirst : bool = True
+                     ,allow_dayfirst : bool = True
+                     ,allow_monthfirst : bool = False
+                     ) -> list[str]:
+    """
+    Build the list of strict formats that are consistent with a parser
+    configuration. ISO 8601 formats are always included, since they can't be
+    confused with anything else.
+    """
+
+    date_fmts = []
+    if allow_yearfirst:
+        date_fmts.append(date_sep.join(["%Y","%m","%d"]))
+    if allow_dayfirst:
+        date_fmts.append(date_sep.join(["%d","%m","%Y"]))
+    if allow_monthfirst:
+        date_fmts.append(date_sep.join(["%m","%d","%Y"]))
+
+    if mode == "date":
+        candidates = date_fmts + ISO_DATE_FORMATS
+    else:
+        time_fmts = [
+            time_sep.join(["%H","%M"]),
+            time_sep.join(["%H","%M","%S"]),
+        ]
+        candidates = [
+            f"{date_fmt}{datetime_sep}{time_fmt}"
+            for date_fmt in date_fmts for time_fmt in time_fmts
+        ] + ISO_DATETIME_FORMATS
+
+    # Preserve order, but don't test the same format twice
+    return list(dict.fromkeys(candidates))
+
+
+def infer_strict_format(series : pl.Series
+                       ,candidates : list[str]
+                       ,mode : str = "datetime"
+                       ,sample_size : int = 1000
+                       ) -> str | None:
+    """
+    Work out whether a string column is in exactly one of a set of strict
+    formats, by checking an evenly spaced sample of its values.
+
+    Parameters
+    ----------
+    `series` : pl.Series
+        The string column to check.
+    `candidates` : list[str]
+        The formats to try, e.g. from `candidate_formats`.
+    `mode` : str, optional
+        "date" or "datetime" - whether to parse the sample as dates or as
+        datetimes. Defaults to "datetime".
+    `sample_size` : int, optional
+        The maximum number of values to check. Defaults to 1000.
+
+    Returns
+    -------
+    `str | None`
+        The single format that every sampled value matches and parses with, or
+        None if no format fits, or if more than one does (e.g. when all the
+        sampled days are <= 12 and we can't tell day first from month first).
+    """
+
+    values = series.drop_nulls()
+    if values.len() == 0:
+        return None
+
+    sample = values.gather_every(max(1, values.len() // sample_size))
+
+    matched = []
+    for fmt in candidates:
+        if not sample.str.contains(format_to_regex(fmt)).all():
+            continue
+        try:
+            if mode == "date":
+                sample.str.to_date(fmt,strict=True)
+            else:
+                sample.str.to_datetime(fmt,strict=True)
+        except pl.exceptions.ComputeError:
+            continue
+        matched.append(fmt)
+
+    if len(matched) != 1:
+        return None
+
+    return matched[0]
+
+
+def stratified_sample(pieces : list[pl.Series]
+                     ,sample_size : int = 1000
+                     ) -> pl.Series:
+    """
+    Draw an evenly spaced sample of about `sample_size` values from a column
+    that is spread over several pieces (sheets, files, partitions), taking an
+    equal share from each piece so that small pieces are represented too.
+    """
+
+    per_piece = max(1, sample_size // max(1, len(pieces)))
+
+    return pl.concat(
+        [
+            piece.rename("sample").to_frame().select(
+                pl.col("sample").gather_every(max(1, piece.len() // per_piece))
+            )
+            for piece in pieces
+        ]
+        ,how="vertical_relaxed"
+    )["sample"]
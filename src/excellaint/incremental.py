@@ -0,0 +1,281 @@
+import copy
+import json
+import os
+import warnings
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+
+from .cache import column_fingerprint
+from .parser import Parser
+
+"""
+Incremental parsing of append-only sources.
+
+Our feeds are workbooks that grow every hour, and re-parsing the whole sheet
+each time is wasteful when all but the last few rows are unchanged. The
+`IncrementalParser` here keeps a watermark per source - how many rows it has
+seen, a fingerprint of the last few of them, the format it locked in and the
+last timestamp it produced - and on later runs only parses the rows appended
+since. If the rows it has already seen have changed, it falls back on a full
+parse.
+"""
+
+@dataclass
+class Watermark():
+    """
+    What we remember about a source between runs.
+
+    Attributes
+    ----------
+    `n_rows` : int
+        The number of rows parsed so far.
+    `tail_hash` : str
+        Fingerprint of the raw date column over the last `tail_rows` rows seen.
+    `tail_rows` : int
+        How many rows `tail_hash` covers.
+    `path` : str
+        The parser path the source was parsed with: "fast", "serial" or
+        "generic".
+    `format` : str | None
+        The strict format locked in for the fast path, if any.
+    `last_timestamp` : str | None
+        The last non-null parsed value, in ISO format.
+    """
+    n_rows : int
+    tail_hash : str
+    tail_rows : int
+    path : str
+    format : str | None
+    last_timestamp : str | None
+
+
+class IncrementalParser():
+    def __init__(self
+                ,parser : Parser
+                ,state_path : str | Path | None = None
+                ,tail_rows : int = 100
+                ):
+        """
+        Wraps a `Parser` so that repeated parses of a growing source only parse
+        the rows appended since the last run.
+
+        Parameters
+        ----------
+        `parser` : Parser
+            The parser to use. It is copied for each run, so isn't modified.
+        `state_path` : str | Path, optional
+            A JSON file to keep the watermarks in between processes. If not
+            given, they are only kept in memory.
+        `tail_rows` : int, optional
+            How many of the last seen rows to fingerprint, in order to check
+            that the source has only been appended to. Defaults to 100.
+        """
+
+        self.parser = parser
+        self.state_path = Path(state_path) if state_path is not None else None
+        self.tail_rows = tail_rows
+
+        self.watermarks = self._load_state()
+        self.last_mode = None
+
+    def __call__(self
+                ,df : pl.DataFrame | pd.DataFrame
+                ,date_column : str
+                ,source : str
+                ) -> pl.DataFrame:
+        """
+        Parse whatever is new in `df` since the last time we saw `source`.
+
+        Parameters:
+        - df: The full contents of the source, as it is now.
+        - date_column: The name of the column to parse.
+        - source: A key identifying the source, e.g. its path and sheet name.
+
+        Returns:
+        - The parsed rows. After a full parse (the first time a source is seen,
+            or if its earlier rows have changed) that's every row; otherwise
+            it's only the newly appended rows, which may be empty.
+            `IncrementalParser.last_mode` says which: "full" or "append".
+        """
+
+        if isinstance(df, pd.DataFrame):
+            df = pl.from_pandas(df)
+
+        watermark = self.watermarks.get(source)
+
+        if watermark is None:
+            return self._parse_full(df,date_column,source)
+
+        if not self._head_unchanged(df,date_column,watermark):
+            warnings.warn(f"The rows already parsed from `{source}` have changed. Re-parsing all of it."
+                         ,category=UserWarning,stacklevel=2)
+            return self._parse_full(df,date_column,source)
+
+        new_rows = df.slice(watermark.n_rows)
+        self.last_mode = "append"
+
+        if new_rows.height == 0:
+            return self._empty_output(df,date_column)
+
+        parser = self._locked_parser(watermark)
+        try:
+            parsed = parser(new_rows,date_column,check_sorted=False)
+        except pl.exceptions.ComputeError:
+            parser = copy.copy(self.parser)
+            parsed = parser(new_rows,date_column,check_sorted=False)
+
+        if parser.last_run["format"] != watermark.format:
+            warnings.warn(f"The new rows of `{source}` are no longer in the format `{watermark.format}`."
+                         ,category=UserWarning,stacklevel=2)
+
+        output_col = parser._output_col()
+        first = parsed[output_col].drop_nulls().head(1)
+        if watermark.last_timestamp is not None and first.len():
+            if _as_datetime(first[0]) < datetime.fromisoformat(watermark.last_timestamp):
+                warnings.warn(f"The new rows of `{source}` start before the last timestamp already parsed"
+                              f" ({watermark.last_timestamp})."
+                             ,category=UserWarning,stacklevel=2)
+
+        self._update_state(df,date_column,source,parser,parsed[output_col],watermark)
+
+        return parsed
+
+    def reset(self
+             ,source : str | None = None
+             ) -> None:
+        """
+        Forget the watermark for a source, or for every source if none is given.
+        """
+
+        if source is None:
+            self.watermarks.clear()
+        else:
+            self.watermarks.pop(source,None)
+
+        self._save_state()
+
+    def _parse_full(self
+                   ,df : pl.DataFrame
+                   ,date_column : str
+                   ,source : str
+                   ) -> pl.DataFrame:
+        parser = copy.copy(self.parser)
+        parsed = parser(df,date_column)
+
+        self.last_mode = "full"
+        self._update_state(df,date_column,source,parser,parsed[parser._output_col()],None)
+
+        return parsed
+
+    def _locked_parser(self
+                      ,watermark : Watermark
+                      ) -> Parser:
+        """
+        A copy of our parser which will parse new rows the same way the earlier
+        ones were: with the locked in format on the fast path, and without
+        trying the fast path at all if the source needed the component
+        pipeline. The format is locked rather than passed as 'date_format', so
+        new rows that don't fit it fall back on the component pipeline instead
+        of raising (or, in lenient mode, being nulled out).
+        """
+
+        parser = copy.copy(self.parser)
+
+        if watermark.path == "fast":
+            parser.locked_format = watermark.format
+        elif watermark.path == "generic":
+            parser.fast_path = False
+
+        return parser
+
+    def _head_unchanged(self
+                       ,df : pl.DataFrame
+                       ,date_column : str
+                       ,watermark : Watermark
+                       ) -> bool:
+        if df.height < watermark.n_rows:
+            return False
+
+        tail = df[date_column].slice(watermark.n_rows - watermark.tail_rows,watermark.tail_rows)
+
+        return column_fingerprint(tail) == watermark.tail_hash
+
+    def _update_state(self
+                     ,df : pl.DataFrame
+                     ,date_column : str
+                     ,source : str
+                     ,parser : Parser
+                     ,parsed : pl.Series
+                     ,previous : Watermark | None
+                     ) -> None:
+        tail_rows = min(self.tail_rows,df.height)
+        tail = df[date_column].slice(df.height - tail_rows,tail_rows)
+
+        last = parsed.drop_nulls().tail(1)
+        last_timestamp = last[0].isoformat() if last.len() else None
+        if last_timestamp is None and previous is not None:
+            last_timestamp = previous.last_timestamp
+
+        self.watermarks[source] = Watermark(
+            n_rows=df.height,
+            tail_hash=column_fingerprint(tail),
+            tail_rows=tail_rows,
+            path=parser.last_run["path"],
+            format=parser.last_run["format"],
+            last_timestamp=last_timestamp,
+        )
+
+        self._save_state()
+
+    def _empty_output(self
+                     ,df : pl.DataFrame
+                     ,date_column : str
+                     ) -> pl.DataFrame:
+        """
+        An empty frame with the same columns a parse would have given us, so 
+        that the results of successive runs can always be concatenated. The 
+        parser itself can't be run on no rows, so the schema is built here.
+        """
+
+        output_col = self.parser._output_col()
+        if output_col == "Datetime":
+            dtype = pl.Datetime(self.parser.time_unit)
+        else:
+            dtype = pl.Date
+
+        columns = [pl.lit(None,dtype=dtype).alias(output_col)]
+        if self.parser.lenient:
+            columns.append(pl.lit(None,dtype=pl.UInt8).alias(self.parser.error_col))
+
+        return df.clear().drop(date_column).with_columns(columns)
+
+    def _load_state(self) -> dict[str,Watermark]:
+        if self.state_path is None or not self.state_path.exists():
+            return {}
+
+        with open(self.state_path) as f:
+            state = json.load(f)
+
+        return {source : Watermark(**watermark) for source, watermark in state.items()}
+
+    def _save_state(self) -> None:
+        if self.state_path is None:
+            return
+
+        state = {source : asdict(watermark) for source, watermark in self.watermarks.items()}
+
+        # Write then rename, so a crash never leaves a half written state file
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        with open(tmp_path,"w") as f:
+            json.dump(state,f,indent=2)
+        os.replace(tmp_path,self.state_path)
+
+
+def _as_datetime(value : date | datetime) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime(value.year,value.month,value.day)
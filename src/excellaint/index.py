@@ -0,0 +1,162 @@
+from datetime import date, datetime
+
+import numpy as np
+import polars as pl
+
+"""
+A lightweight time range index over a parsed column.
+
+Pulling out the rows between two timestamps with a filter scans the whole
+column every time. `TimeIndex` instead splits the column into fixed size blocks
+and keeps the minimum and maximum of each. For a sorted column (which the
+parser flags when it can) a lookup is a binary search over the block maxima
+followed by one inside a single block, so it costs O(log n) and hands back a
+contiguous slice. For an unsorted column the block bounds still let a lookup
+skip every block that can't hold a match, and only the rest are scanned.
+"""
+
+DEFAULT_BLOCK_SIZE = 4096
+
+
+class TimeIndex():
+    def __init__(self
+                ,series : pl.Series
+                ,block_size : int = DEFAULT_BLOCK_SIZE
+                ):
+        """
+        Index a Date or Datetime column for time range lookups.
+
+        Parameters
+        ----------
+        `series` : pl.Series
+            The column to index, e.g. the `Datetime` column of a parsed frame.
+            The index holds on to its values, so shouldn't outlive changes to
+            the frame.
+        `block_size` : int, optional
+            The number of rows summarised by each block's min and max. Defaults
+            to 4096.
+
+        Raises
+        ------
+        `TypeError`
+            If the column isn't a Date or Datetime.
+        """
+
+        if not (series.dtype == pl.Date or isinstance(series.dtype, pl.Datetime)):
+            raise TypeError(f"Can only index a Date or Datetime column, not {series.dtype}")
+
+        if block_size < 1:
+            raise ValueError(f"block_size must be at least 1. Got: {block_size}")
+
+        self.dtype = series.dtype
+        self.block_size = block_size
+        self.is_sorted = series.is_sorted()
+
+        # Nulls never fall in a range. In a sorted column they all come first,
+        # so we just skip them; otherwise they get a value below any bound.
+        self.n_rows = series.len()
+        self.offset = series.null_count() if self.is_sorted else 0
+
+        physical = series.slice(self.offset).to_physical().cast(pl.Int64)
+        self.values = physical.fill_null(np.iinfo(np.int64).min).to_numpy()
+
+        starts = np.arange(0,len(self.values),block_size)
+        if len(self.values):
+            self.block_min = np.minimum.reduceat(self.values,starts)
+            self.block_max = np.maximum.reduceat(self.values,starts)
+        else:
+            self.block_min = self.block_max = np.zeros(0,dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def range(self
+             ,start : date | datetime | None = None
+             ,end : date | datetime | None = None
+             ) -> slice:
+        """
+        The rows of a sorted column with `start <= value < end`, as a slice.
+        Either bound can be None to leave that end open.
+
+        Raises
+        ------
+        `ValueError`
+            If the column isn't sorted, so its matches aren't contiguous. Use
+            `TimeIndex.rows` instead.
+        """
+
+        if not self.is_sorted:
+            raise ValueError("The indexed column isn't sorted. Use `TimeIndex.rows` instead.")
+
+        first = 0 if start is None else self._search(self._physical(start))
+        last = len(self.values) if end is None else self._search(self._physical(end))
+
+        return slice(self.offset + first, self.offset + max(first, last))
+
+    def rows(self
+            ,start : date | datetime | None = None
+            ,end : date | datetime | None = None
+            ) -> np.ndarray:
+        """
+        The positions of the rows with `start <= value < end`, in row order.
+        Either bound can be None to leave that end open.
+        """
+
+        if self.is_sorted:
+            bounds = self.range(start,end)
+            return np.arange(bounds.start,bounds.stop)
+
+        lower = np.iinfo(np.int64).min + 1 if start is None else self._physical(start)
+        upper = np.iinfo(np.int64).max if end is None else self._physical(end)
+
+        candidates = np.flatnonzero((self.block_max >= lower) & (self.block_min < upper))
+
+        positions = []
+        for block in candidates:
+            block_start = block * self.block_size
+            values = self.values[block_start:block_start + self.block_size]
+            positions.append(block_start + np.flatnonzero((values >= lower) & (values < upper)))
+
+        if not positions:
+            return np.zeros(0,dtype=np.int64)
+
+        return np.concatenate(positions)
+
+    def filter(self
+              ,df : pl.DataFrame
+              ,start : date | datetime | None = None
+              ,end : date | datetime | None = None
+              ) -> pl.DataFrame:
+        """
+        The rows of `df` - the frame the indexed column came from - with
+        `start <= value < end`. For a sorted column this is a zero-copy slice.
+        """
+
+        if self.is_sorted:
+            bounds = self.range(start,end)
+            return df.slice(bounds.start,bounds.stop - bounds.start)
+
+        return df[self.rows(start,end)]
+
+    def _physical(self
+                 ,value : date | datetime
+                 ) -> int:
+        return pl.Series([value]).cast(self.dtype).to_physical().cast(pl.Int64)[0]
+
+    def _search(self
+               ,value : int
+               ) -> int:
+        """
+        The first position in a sorted column whose value is >= `value`: find
+        the block with a binary search over the block maxima, then search
+        inside it.
+        """
+
+        block = int(np.searchsorted(self.block_max,value,side="left"))
+        if block == len(self.block_max):
+            return len(self.values)
+
+        block_start = block * self.block_size
+        values = self.values[block_start:block_start + self.block_size]
+
+        return block_start + int(np.searchsorted(values,value,side="left"))
@@ -0,0 +1,51 @@
+import os
+from pathlib import Path
+
+import pyarrow as pa
+
+"""
+Arrow IPC (Feather v2) hand-off between processes.
+
+Our ingestion runs as a reader, a parser and a loader in separate processes.
+Passing frames between them as pickles or CSV means serialising and copying
+every column at each step, even though the parser only ever looks at one of
+them. Here an IPC file is memory mapped, so the only column actually read from
+disk is the date column the parser asks for. The rest are handed straight from
+the mapped input to the output file without ever being loaded into polars.
+"""
+
+
+def read_ipc_table(path : str | Path) -> pa.Table:
+    """
+    Memory map an Arrow IPC file (or stream) as a table. Nothing is read from
+    disk until a column's buffers are touched.
+    """
+
+    source = pa.memory_map(str(path),"r")
+
+    try:
+        return pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        source.seek(0)
+        return pa.ipc.open_stream(source).read_all()
+
+
+def write_ipc_table(table : pa.Table
+                   ,path : str | Path
+                   ) -> None:
+    """
+    Write a table to an uncompressed Arrow IPC file, so that the next process
+    can memory map it in turn.
+    """
+
+    path = Path(path)
+
+    # Write then rename, so a crash never leaves a half written file for the
+    # next process to pick up
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with pa.ipc.new_file(str(tmp_path),table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path,path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
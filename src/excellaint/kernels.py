@@ -0,0 +1,174 @@
+import numpy as np
+import polars as pl
+import pyarrow as pa
+
+"""
+Zero-copy component extraction for fixed-width date strings.
+
+If every string in a column has the same length and the separators all sit in
+the same places - `01/01/2020 12:00`, say - then every digit of every component
+is at a known byte offset from the start of its string. Rather than splitting
+the strings (which allocates a list column and a new string column for every
+component), we can read the Arrow offsets and data buffers behind the column as
+NumPy views and compute each component as an integer array with a bit of byte
+arithmetic.
+
+Polars keeps its strings in a "string view" layout internally, so handing a
+polars column to these functions costs one contiguous copy of its bytes when it
+is exported to Arrow. An Arrow `string`/`large_string` array (e.g. straight out
+of an IPC file or a pyarrow table) is read without any copying at all.
+"""
+
+ASCII_ZERO = ord("0")
+
+
+def string_buffers(series : pl.Series | pa.Array | pa.ChunkedArray
+                  ) -> tuple[np.ndarray,np.ndarray,np.ndarray | None]:
+    """
+    Get NumPy views of the offsets and data buffers behind a string column,
+    along with its validity mask.
+
+    For a single chunk Arrow array the returned offsets and data arrays are 
+    views of the array's own memory. A polars column is exported to Arrow 
+    first, and a chunked array has to be combined, both of which copy it once.
+
+    Parameters
+    ----------
+    `series` : pl.Series | pa.Array | pa.ChunkedArray
+        A string column.
+
+    Returns
+    -------
+    `tuple[np.ndarray,np.ndarray,np.ndarray | None]`
+        The offsets (one more than the number of rows), the UTF-8 bytes, and a
+        boolean array which is True for non-null rows (or None if there are
+        no nulls).
+    """
+
+    if isinstance(series, pl.Series):
+        if series.dtype != pl.Utf8:
+            raise TypeError(f"Expected a string column, got {series.dtype}")
+        arr = series.to_arrow()
+    else:
+        arr = series
+
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        raise TypeError(f"Expected a string column, got {arr.type}")
+
+    validity_buf, offsets_buf, data_buf = arr.buffers()
+
+    offset_dtype = np.int64 if pa.types.is_large_string(arr.type) else np.int32
+    offsets = np.frombuffer(offsets_buf,dtype=offset_dtype)[arr.offset:arr.offset + len(arr) + 1]
+
+    if data_buf is None:
+        data = np.zeros(0,dtype=np.uint8)
+    else:
+        data = np.frombuffer(data_buf,dtype=np.uint8)
+
+    valid = None
+    if arr.null_count:
+        valid = arr.is_valid().to_numpy(zero_copy_only=False)
+
+    return offsets, data, valid
+
+
+def fixed_width_layout(value : str
+                      ,separators : list[str]
+                      ) -> list[tuple[int,int]] | None:
+    """
+    Work out where the digit runs in a string are, given the separators that
+    are allowed between them.
+
+    Returns a list of (start, width) pairs, one per component, or None if the
+    string contains anything other than ASCII digits and the given separators.
+    """
+
+    layout = []
+    start = None
+    for pos, char in enumerate(value):
+        if char.isascii() and char.isdigit():
+            if start is None:
+                start = pos
+        elif char in separators and start is not None:
+            layout.append((start, pos - start))
+            start = None
+        else:
+            return None
+
+    if start is None:
+        return None
+    layout.append((start, len(value) - start))
+
+    return layout
+
+
+def extract_fixed_width(series : pl.Series | pa.Array | pa.ChunkedArray
+                       ,separators : list[str]
+                       ) -> tuple[list[np.ndarray],list[int]] | None:
+    """
+    Extract every numeric component of a fixed-width string column as an
+    integer array, by reading digits straight out of the Arrow data buffer.
+
+    Parameters
+    ----------
+    `series` : pl.Series | pa.Array | pa.ChunkedArray
+        The string column, e.g. of "01/01/2020 12:00".
+    `separators` : list[str]
+        The single character separators that may appear between components.
+
+    Returns
+    -------
+    `tuple[list[np.ndarray],list[int]] | None`
+        One UInt16 array per component, in the order they appear in the string,
+        and the width of each component. Null rows come out as 0, so should be
+        masked by the caller. Returns None if the column isn't fixed width, or
+        any row has something other than a digit where a digit should be.
+    """
+
+    offsets, data, valid = string_buffers(series)
+
+    starts = offsets[:-1]
+    lengths = np.diff(offsets)
+
+    if valid is not None:
+        starts = starts[valid]
+        lengths = lengths[valid]
+
+    if len(starts) == 0:
+        return None
+
+    width = int(lengths[0])
+    if not (lengths == width).all():
+        return None
+
+    first = bytes(data[starts[0]:starts[0] + width]).decode("ascii",errors="replace")
+    layout = fixed_width_layout(first,separators)
+    if layout is None:
+        return None
+
+    # Every separator must be in the same place, in every row
+    digit_positions = {start + k for start, n_digits in layout for k in range(n_digits)}
+    for pos in range(width):
+        if pos not in digit_positions and not (data[starts + pos] == data[starts[0] + pos]).all():
+            return None
+
+    components = []
+    for start, n_digits in layout:
+        value = np.zeros(len(starts),dtype=np.uint16)
+        for k in range(n_digits):
+            digit = data[starts + start + k].astype(np.int16) - ASCII_ZERO
+            if ((digit < 0) | (digit > 9)).any():
+                return None
+            value = value * 10 + digit.astype(np.uint16)
+
+        if valid is not None:
+            full = np.zeros(len(valid),dtype=np.uint16)
+            full[valid] = value
+            value = full
+
+        components.append(value)
+
+    return components, [n_digits for _, n_digits in layout]
@@ -0,0 +1,193 @@
+"""
+Month and weekday names, for dates like `01-Jan-20`, `Mon 03/02/2020` or
+`03 janv. 2020`.
+
+Rather than parsing these row by row with `strptime`, the parser pulls the name
+out of every row with a regex and turns it into a number with a single
+vectorised lookup against the tables built here, after which the column looks
+like any other numeric one. Names are matched in lower case, without any
+trailing full stop, and every name (and abbreviation) that Excel commonly
+produces for a locale is included - with and without accents, where people tend
+to drop them.
+"""
+
+# One tuple of accepted names per month, January first
+MONTH_NAMES = {
+    "en" : [
+        ("january", "jan"),
+        ("february", "feb"),
+        ("march", "mar"),
+        ("april", "apr"),
+        ("may",),
+        ("june", "jun"),
+        ("july", "jul"),
+        ("august", "aug"),
+        ("september", "sep", "sept"),
+        ("october", "oct"),
+        ("november", "nov"),
+        ("december", "dec"),
+    ],
+    "fr" : [
+        ("janvier", "janv", "jan"),
+        ("février", "fevrier", "févr", "fevr", "fév", "fev"),
+        ("mars", "mar"),
+        ("avril", "avr"),
+        ("mai",),
+        ("juin",),
+        ("juillet", "juil"),
+        ("août", "aout"),
+        ("septembre", "sept"),
+        ("octobre", "oct"),
+        ("novembre", "nov"),
+        ("décembre", "decembre", "déc", "dec"),
+    ],
+    "de" : [
+        ("januar", "jan"),
+        ("februar", "feb"),
+        ("märz", "maerz", "marz", "mär", "mrz"),
+        ("april", "apr"),
+        ("mai",),
+        ("juni", "jun"),
+        ("juli", "jul"),
+        ("august", "aug"),
+        ("september", "sep", "sept"),
+        ("oktober", "okt"),
+        ("november", "nov"),
+        ("dezember", "dez"),
+    ],
+    "es" : [
+        ("enero", "ene"),
+        ("febrero", "feb"),
+        ("marzo", "mar"),
+        ("abril", "abr"),
+        ("mayo", "may"),
+        ("junio", "jun"),
+        ("julio", "jul"),
+        ("agosto", "ago"),
+        ("septiembre", "setiembre", "sep", "sept", "set"),
+        ("octubre", "oct"),
+        ("noviembre", "nov"),
+        ("diciembre", "dic"),
+    ],
+    "it" : [
+        ("gennaio", "gen"),
+        ("febbraio", "feb"),
+        ("marzo", "mar"),
+        ("aprile", "apr"),
+        ("maggio", "mag"),
+        ("giugno", "giu"),
+        ("luglio", "lug"),
+        ("agosto", "ago"),
+        ("settembre", "set"),
+        ("ottobre", "ott"),
+        ("novembre", "nov"),
+        ("dicembre", "dic"),
+    ],
+    "nl" : [
+        ("januari", "jan"),
+        ("februari", "feb"),
+        ("maart", "mrt"),
+        ("april", "apr"),
+        ("mei",),
+        ("juni", "jun"),
+        ("juli", "jul"),
+        ("augustus", "aug"),
+        ("september", "sep", "sept"),
+        ("oktober", "okt"),
+        ("november", "nov"),
+        ("december", "dec"),
+    ],
+}
+
+# One tuple of accepted names per weekday, Monday first
+WEEKDAY_NAMES = {
+    "en" : [
+        ("monday", "mon"),
+        ("tuesday", "tue", "tues"),
+        ("wednesday", "wed"),
+        ("thursday", "thu", "thur", "thurs"),
+        ("friday", "fri"),
+        ("saturday", "sat"),
+        ("sunday", "sun"),
+    ],
+    "fr" : [
+        ("lundi", "lun"),
+        ("mardi", "mar"),
+        ("mercredi", "mer"),
+        ("jeudi", "jeu"),
+        ("vendredi", "ven"),
+        ("samedi", "sam"),
+        ("dimanche", "dim"),
+    ],
+    "de" : [
+        ("montag", "mo"),
+        ("dienstag", "di"),
+        ("mittwoch", "mi"),
+        ("donnerstag", "do"),
+        ("freitag", "fr"),
+        ("samstag", "sonnabend", "sa"),
+        ("sonntag", "so"),
+    ],
+    "es" : [
+        ("lunes", "lun"),
+        ("martes", "mar"),
+        ("miércoles", "miercoles", "mié", "mie"),
+        ("jueves", "jue"),
+        ("viernes", "vie"),
+        ("sábado", "sabado", "sáb", "sab"),
+        ("domingo", "dom"),
+    ],
+    "it" : [
+        ("lunedì", "lunedi", "lun"),
+        ("martedì", "martedi", "mar"),
+        ("mercoledì", "mercoledi", "mer"),
+        ("giovedì", "giovedi", "gio"),
+        ("venerdì", "venerdi", "ven"),
+        ("sabato", "sab"),
+        ("domenica", "dom"),
+    ],
+    "nl" : [
+        ("maandag", "ma"),
+        ("dinsdag", "di"),
+        ("woensdag", "wo"),
+        ("donderdag", "do"),
+        ("vrijdag", "vr"),
+        ("zaterdag", "za"),
+        ("zondag", "zo"),
+    ],
+}
+
+
+def _lookup(table : dict[str,list[tuple[str,...]]]
+           ,locales : list[str]
+           ,kind : str
+           ) -> dict[str,int]:
+    lookup = {}
+    for locale in locales:
+        if locale not in table:
+            raise ValueError(f"Unknown locale {locale}. Must be one of {list(table)}")
+
+        for number, names in enumerate(table[locale],start=1):
+            for name in names:
+                if lookup.setdefault(name,number) != number:
+                    raise ValueError(f"The {kind} name `{name}` means different things in locales {locales}")
+
+    return lookup
+
+
+def month_lookup(locales : list[str]) -> dict[str,int]:
+    """
+    Map every month name and abbreviation in the given locales to its number,
+    January being 1. Raises a ValueError for an unknown locale, or if two of
+    the locales disagree about what a name means.
+    """
+    return _lookup(MONTH_NAMES,locales,"month")
+
+
+def weekday_lookup(locales : list[str]) -> dict[str,int]:
+    """
+    Map every weekday name and abbreviation in the given locales to its ISO
+    number, Monday being 1. Raises a ValueError for an unknown locale, or if
+    two of the locales disagree about what a name means.
+    """
+    return _lookup(WEEKDAY_NAMES,locales,"weekday")
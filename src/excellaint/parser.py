@@ -1,11 +1,26 @@
+import copy
+import re
 import warnings
-from datetime import date
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from pprint import pformat
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import polars.selectors as cs
 
+from .cache import DEFAULT_CACHE, ComponentCache, column_fingerprint
+from .cadence import Cadence, detect_cadence
+from .errors import ERROR_COL, ParseError
+from .formats import candidate_formats, infer_strict_format
+from .ipc import read_ipc_table, write_ipc_table
+from .kernels import extract_fixed_width
+from .locales import month_lookup, weekday_lookup
+from .partition import is_sorted
+from .progress import CancellationToken, ProgressCallback
+from .scan import find_date_columns
+
 """
 Excellaint - A Python toolbox for dealing with some of the oddities that Excel 
 can introduce introduce
@@ -25,6 +40,77 @@ then think about how to make it more efficient, and maybe generating an interfac
 which is more congruent with polars and its plugin ecosystem.
 """
 
+# Excel counts days from 1899-12-30, so that 1900-03-01 onwards comes out right
+# despite its imaginary 29th of February 1900.
+EXCEL_EPOCH = datetime(1899,12,30)
+EXCEL_EPOCH_OFFSET = (datetime(1970,1,1) - EXCEL_EPOCH).days
+
+NS_PER_UNIT = {
+    "ns" : 1,
+    "us" : 1_000,
+    "ms" : 1_000_000,
+}
+NS_PER_DAY = 86_400_000_000_000
+
+# What `snap` can round to, in nanoseconds. "cadence" is worked out per column.
+SNAP_NS = {
+    "second" : 1_000_000_000,
+    "minute" : 60_000_000_000,
+}
+
+# How sure the scan has to be of a numeric column before `parse_columns` will
+# replace it unasked. Getting a string column wrong leaves nulls; getting a 
+# numeric one wrong turns its numbers into dates.
+NUMERIC_MIN_SCORE = 0.95
+
+# What a single column can fail with in `parse_columns` without stopping the
+# others. Cancellation isn't one of them.
+COLUMN_ERRORS = (
+    pl.exceptions.PolarsError,
+    AssertionError,
+    NotImplementedError,
+    ValueError,
+)
+
+
+def _days_in_month(year : pl.Expr
+                  ,month : pl.Expr
+                  ) -> pl.Expr:
+    """
+    Number of days in the given month, as an integer expression.
+    """
+    year = year.cast(pl.Int32)
+    is_leap = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+
+    return (
+        pl.when(month == 2).then(28 + is_leap.cast(pl.Int32))
+        .when(month.is_in([4,6,9,11])).then(30)
+        .otherwise(31)
+    )
+
+
+def _days_from_civil(year : pl.Expr
+                    ,month : pl.Expr
+                    ,day : pl.Expr
+                    ) -> pl.Expr:
+    """
+    Days since 1970-01-01 for a year, month and day, using only integer 
+    arithmetic. This is Howard Hinnant's `days_from_civil`: shifting the start 
+    of the year to March puts the leap day at the end, so the day of the year 
+    is a simple linear function of the month.
+    """
+    year = year.cast(pl.Int32)
+    month = month.cast(pl.Int32)
+    day = day.cast(pl.Int32)
+
+    year = year - (month <= 2).cast(pl.Int32)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+
+    return era * 146097 + day_of_era - 719468
+
 class Parser():
     def __init__(self
                 ,mode : str = "date"
@@ -40,6 +126,18 @@ class Parser():
                 ,allow_monthfirst : bool = False
                 ,allow_dayfirst : bool = True
                 ,allow_yearfirst : bool = True
+                ,lenient : bool = False
+                ,date_format : str | None = None
+                ,fast_path : bool = True
+                ,output_dtype : str | None = None
+                ,time_unit : str = "us"
+                ,engine : str = "split"
+                ,cache : ComponentCache | bool = False
+                ,n_partitions : int = 1
+                ,locale : str | list[str] | None = None
+                ,snap : str | None = None
+                ,progress : ProgressCallback | None = None
+                ,cancel : CancellationToken | None = None
                 ,verbose_config : bool = False
                 ):
         """
@@ -51,6 +149,65 @@ class Parser():
         If you set 'verbose_config' to True, the parser will let you know of any
         assumptions it has made about the data it is parsing.
 
+        If you set 'lenient' to True, rows that can't be parsed will come back 
+        as nulls instead of raising for the whole column, and the output will 
+        gain an 'excellaint_error' column of `ParseError` codes saying what went
+        wrong with each row. Use `excellaint.error_summary` to aggregate them.
+
+        If the column turns out to be in a single strict format (e.g. 
+        '2020/01/01 01:00' or ISO 8601), it is parsed directly with 
+        `str.to_datetime` rather than being split into components. You can pass
+        that format yourself as 'date_format', or set 'fast_path' to False to 
+        always use the component pipeline. The path taken on the last call is 
+        recorded in `Parser.last_run`.
+
+        If the parsed column comes out sorted, it is flagged as such, for the 
+        benefit of `join_asof`, `group_by_dynamic` and `excellaint.TimeIndex`.
+
+        'output_dtype' can be "datetime" or "date", and defaults to whatever 
+        'mode' is. 'time_unit' sets the unit of a datetime output: "ns", "us" 
+        or "ms". Both are built directly from the integer components, so asking
+        for a `Date` doesn't cost you a full datetime along the way.
+
+        'engine' chooses how the component pipeline gets at the components. 
+        "split" splits the strings on their separators, which works for 
+        anything. "fixed_width" reads the digits straight out of the Arrow 
+        buffers when every string has the same layout, which is much faster and
+        allocates far less, falling back on "split" when they don't.
+
+        If 'cache' is True (or a `ComponentCache`), the split components of each 
+        column are cached, so that parsing the same column again with, say, 
+        'allow_dayfirst' flipped only re-runs the stages after the split. 
+        Setting it to True uses a cache shared between all parsers.
+
+        'n_partitions' splits the stages that depend on row order - the sort 
+        check and the cadence - into that many row partitions, run in parallel 
+        and stitched back together. The result is the same whatever it is set 
+        to; it's only worth raising for very long columns.
+
+        'locale' (e.g. "en", "fr", or a list of them) turns on month names and 
+        weekday prefixes, as in '01-Jan-20', 'Mon 03/02/2020' or '03 janv. 2020'.
+        Month names are swapped for their numbers before parsing, so 'date_sep' 
+        still needs to match whatever separates the components. A leading 
+        weekday is stripped, and checked against the parsed date: rows where it
+        doesn't match raise a warning, or are nulled out with a 
+        `WEEKDAY_MISMATCH` error in lenient mode.
+
+        'snap' rounds a datetime output to the nearest "second", "minute" or 
+        "cadence" (the column's own detected frequency), to undo the floating 
+        point drift Excel leaves in times - '10:59:59.999' and the like. How 
+        many rows moved, and by how much at most, is recorded in 
+        `Parser.last_run["snap"]`.
+
+        'progress' is called as `progress(stage, piece, rows_done, rows_total)`
+        as each stage of a parse finishes, and 'cancel' is a 
+        `CancellationToken` that is checked at the same points - cancelling it
+        raises `ParseCancelled` at the next one. Both carry over to 
+        `parse_workbook`, `parse_dataset` and `Parser.parse_ipc`, none of which
+        leave partial output behind. 'piece' is the sheet, file or column 
+        being parsed (set in `Parser.piece`, None for a lone frame), and 
+        'rows_done' is how many of its 'rows_total' rows are finished.
+
         """
 
         match mode:
@@ -63,6 +220,28 @@ class Parser():
             case _:
                 raise ValueError(f"mode must be one of 'date', 'time', or 'datetime'. Got: {mode}")
 
+        if output_dtype not in (None, "date", "datetime"):
+            raise ValueError(f"output_dtype must be one of 'date' or 'datetime'. Got: {output_dtype}")
+
+        if engine not in ("split", "fixed_width"):
+            raise ValueError(f"engine must be one of 'split' or 'fixed_width'. Got: {engine}")
+
+        if time_unit not in NS_PER_UNIT:
+            raise ValueError(f"time_unit must be one of {list(NS_PER_UNIT)}. Got: {time_unit}")
+
+        if n_partitions < 1:
+            raise ValueError(f"n_partitions must be at least 1. Got: {n_partitions}")
+
+        if snap not in (None, "cadence", *SNAP_NS):
+            raise ValueError(f"snap must be one of {[*SNAP_NS, 'cadence']}. Got: {snap}")
+
+        if isinstance(locale, str):
+            locale = [locale]
+        if locale is not None:
+            # Build the lookups up front, so a bad locale fails here
+            month_lookup(locale)
+            weekday_lookup(locale)
+
         self.verbose_config = verbose_config
 
         self.mode = mode
@@ -80,7 +259,31 @@ class Parser():
         self.allow_dayfirst = allow_dayfirst
         self.allow_yearfirst = allow_yearfirst
 
+        self.lenient = lenient
+        self.date_format = date_format
+        self.locked_format = None
+        self.fast_path = fast_path
+        self.output_dtype = output_dtype
+        self.time_unit = time_unit
+        self.engine = engine
+
+        if cache is True:
+            cache = DEFAULT_CACHE
+        elif cache is False:
+            cache = None
+        self.cache = cache
+        self.n_partitions = n_partitions
+        self.locale = locale
+        self.snap = snap
+        self.progress = progress
+        self.cancel = cancel
+        self.piece = None
+
+        self.last_run = {}
+
         self.index_col = "excellaint_index"
+        self.raw_col = "excellaint_raw"
+        self.error_col = ERROR_COL
 
     def __str__(self):
         cfg_dict = {
@@ -96,15 +299,27 @@ class Parser():
             "datetime_sep": self.datetime_sep,
             "allow_monthfirst": self.allow_monthfirst,
             "allow_dayfirst": self.allow_dayfirst,
-            "allow_yearfirst": self.allow_yearfirst
+            "allow_yearfirst": self.allow_yearfirst,
+            "lenient": self.lenient,
+            "date_format": self.date_format,
+            "locked_format": self.locked_format,
+            "fast_path": self.fast_path,
+            "output_dtype": self._output_dtype(),
+            "time_unit": self.time_unit,
+            "engine": self.engine,
+            "cache": self.cache is not None,
+            "n_partitions": self.n_partitions,
+            "locale": self.locale,
+            "snap": self.snap,
         }
         return f"ExcellAint Configuration:\n{pformat(cfg_dict,indent=4)}"
 
     def __call__(self
-                ,df : pl.DataFrame | pd.DataFrame
+                ,df : pl.DataFrame | pd.DataFrame | str | Path
                 ,date_column : str
                 ,check_sorted : bool = True
-                ) -> pl.DataFrame:
+                ,return_cadence : bool = False
+                ) -> pl.DataFrame | tuple[pl.DataFrame,Cadence]:
         
         """
         Parse an excel date column. This will take a column of dates that have 
@@ -113,68 +328,802 @@ class Parser():
 
         Parameters:
         - df: The dataframe that contains the column you want to parse. Must be 
-            either a polars dataframe or a pandas dataframe.
-        - column_name: The name of the column that you want to parse
+            either a polars dataframe, a pandas dataframe, or the path of an 
+            Arrow IPC (Feather) file, which is memory mapped. To write the 
+            result straight back out without loading the other columns, use
+            `Parser.parse_ipc`.
+        - column_name: The name of the column that you want to parse. This can 
+            be a string column, or a float column of Excel serial dates.
         - check_sorted: Whether to check if the column is sorted. If the column 
             is not sorted, then we will not be able to parse it - since we will 
             not be able to determine the order of the date, month, and year.
+        - return_cadence: Whether to also return a `Cadence` describing the 
+            inferred frequency of the parsed column, along with a side table of 
+            any gaps and duplicated timestamps. This is computed from the parsed
+            column directly, so saves a second pass over the data.
 
         Returns:
         - A new dataframe with the column parsed, with the datatype converted to 
             a datetime. You can then choose how to write this back out to a file
              - either as a datetime, or as a string, etc.
+        - If `return_cadence` is True, a tuple of the dataframe and its `Cadence`.
         """
 
-        if isinstance(df, pd.DataFrame):
+        if isinstance(df, (str, Path)):
+            df = pl.read_ipc(df,memory_map=True)
+        elif isinstance(df, pd.DataFrame):
             df = pl.from_pandas(df)
         elif not isinstance(df, pl.DataFrame):
-            raise TypeError("df must be either a polars or pandas dataframe")
+            raise TypeError("df must be either a polars or pandas dataframe, or an IPC file path")
 
         if date_column not in df.columns:
             raise ValueError(f"Column {date_column} not found in dataframe")
 
+        n_rows = df.height
+        self._checkpoint("start",0,n_rows)
+
         df = self._add_index(df)
 
+        # Only the date column goes through the split/pivot machinery, 
+        # everything else is joined back on at the end. It goes through under
+        # a name of our own, so that a column called e.g. "Date" can't clash
+        # with the columns the pipeline creates along the way.
+        passthrough = df.drop(date_column)
+        df = df.select(self.index_col,pl.col(date_column).alias(self.raw_col))
+
+        fix_datetime_sorting = False
         if check_sorted:
-            if df[date_column].is_sorted():
-                fix_datetime_sorting = False
-            else:
+            if not is_sorted(df[self.raw_col],self.n_partitions):
                 warnings.warn(f"`{date_column}` is not sorted. This will cause problems."
                              ,category=UserWarning,stacklevel=2)
                 fix_datetime_sorting = True
+            self._checkpoint("sort_check",0,n_rows)
+
+        fmt = None
+        parsed = None
+        weekdays = None
+        month_col = None
+        if df.schema[self.raw_col] in (pl.Float32, pl.Float64):
+            fmt = "excel_serial"
+            parsed = self._parse_excel_serial(df,self.raw_col)
+        else:
+            self._check_datetime_col_dtype(df,self.raw_col)
+            if self.locale is not None:
+                df, weekdays, month_col = self._replace_names(df,self.raw_col)
+            fmt = self._dispatch_format(df,self.raw_col,month_col)
+
+        if parsed is None and fmt is not None:
+            parsed = self._parse_with_format(df,self.raw_col,fmt)
+
+        if parsed is None:
+            df, engine, cached = self._parse_components(df,self.raw_col,month_col)
+            self.last_run = {"path": "generic", "format": None, "engine": engine, "cached": cached}
+        else:
+            df = parsed
+            self.last_run = {"path": "serial" if fmt == "excel_serial" else "fast", "format": fmt}
+
+        self._checkpoint("parse",0,n_rows)
+
+        if self.verbose_config:
+            warnings.warn(f"Parsed `{date_column}` using the {self.last_run['path']} path"
+                          f" (format: {self.last_run['format']})."
+                         ,category=UserWarning,stacklevel=2)
+
+        output_col = self._output_col()
+
+        if self.snap is not None:
+            df = self._snap(df)
+
+        if weekdays is not None:
+            df = self._check_weekdays(df,weekdays,date_column)
+
+        if fix_datetime_sorting:
+            pass
+
+        df = passthrough.join(df,on=self.index_col,how="left",coalesce=True)
+        self._checkpoint("join",0,n_rows)
+
+        if return_cadence:
+            cadence = detect_cadence(df,output_col,row_col=self.index_col,n_partitions=self.n_partitions)
+            self._checkpoint("cadence",0,n_rows)
+
+        df = self._clean_index(df)
+
+        # Flag the output as sorted when it is, so that e.g. `join_asof` and 
+        # `group_by_dynamic` don't have to check (or sort) it again.
+        if is_sorted(df[output_col],self.n_partitions):
+            df = df.with_columns(pl.col(output_col).set_sorted())
+
+        if self.lenient:
+            n_errors = (df[self.error_col] != ParseError.OK).sum()
+            if n_errors:
+                warnings.warn(f"{n_errors} rows of `{date_column}` could not be parsed and have been set to null."
+                              " See `excellaint.error_summary` for details."
+                             ,category=UserWarning,stacklevel=2)
+
+        self._checkpoint("done",n_rows,n_rows)
+
+        if return_cadence:
+            return df, cadence
+
+        return df
+
+    def parse_columns(self
+                     ,df : pl.DataFrame | pd.DataFrame
+                     ,columns : list[str] | None = None
+                     ,check_sorted : bool = False
+                     ,sample_size : int = 1000
+                     ,min_score : float = 0.8
+                     ) -> pl.DataFrame:
+        """
+        Parse several date columns in one go. If `columns` isn't given, the 
+        frame is scanned with `excellaint.find_date_columns` and every column 
+        that looks like a date is parsed, each with the mode, separators and 
+        format the scan inferred for it. Parsed columns keep their names. In 
+        lenient mode each one gets its own error column, named 
+        '<column>_excellaint_error'.
+
+        A column that can't be parsed (say, one the scan mistook for dates) 
+        is left as it is, with a warning, rather than stopping the rest - 
+        `Parser.last_run[column]` records why it was skipped. Discovered 
+        numeric columns are only parsed if the scan scores them at least 
+        0.95, since parsing a column of amounts as serials would quietly 
+        replace them.
+
+        Parameters:
+        - df: The dataframe containing the columns you want to parse.
+        - columns: The columns to parse. If None, they are discovered.
+        - check_sorted: Whether to warn about columns that aren't sorted. Off 
+            by default, since wide vendor sheets are often full of unsorted 
+            date columns.
+        - sample_size: The number of values per column the scan looks at.
+        - min_score: The fraction of sampled values that must look like a date
+            for a column to be parsed.
+
+        Returns:
+        - A new dataframe with every discovered column parsed, and any error 
+            columns on the end.
+        """
+
+        if isinstance(df, pd.DataFrame):
+            df = pl.from_pandas(df)
+
+        found = find_date_columns(df
+                                 ,sample_size=sample_size
+                                 ,min_score=0 if columns is not None else min_score
+                                 ,allow_yearfirst=self.allow_yearfirst
+                                 ,allow_dayfirst=self.allow_dayfirst
+                                 ,allow_monthfirst=self.allow_monthfirst)
+
+        if columns is not None:
+            missing = set(columns) - set(found["column"])
+            if missing:
+                raise ValueError(f"Columns {sorted(missing)} don't look like dates")
+            found = found.filter(pl.col("column").is_in(columns))
+        else:
+            found = found.filter(
+                (pl.col("format") != "excel_serial").fill_null(True)
+                | (pl.col("score") >= NUMERIC_MIN_SCORE)
+            )
+
+        runs = {}
+        parsed_cols = []
+        for row in found.iter_rows(named=True):
+            column = row["column"]
+
+            col_parser = copy.copy(self)
+            col_parser.mode = row["mode"]
+            col_parser.date_sep = row["date_sep"] or self.date_sep
+            col_parser.datetime_sep = row["datetime_sep"] or self.datetime_sep
+            col_parser.piece = column
+
+            # The scan has already inferred the format from its sample, so 
+            # there's no need to infer it again
+            if row["format"] not in (None, "excel_serial"):
+                col_parser.locked_format = row["format"]
+
+            # Only the column itself goes through the parser, so that the rest
+            # of the frame (which may well have a "Date" column of its own) 
+            # can't clash with the parser's output names.
+            try:
+                parsed = col_parser(df.select(column),column,check_sorted=check_sorted)
+            except COLUMN_ERRORS as err:
+                warnings.warn(f"Could not parse `{column}`, so it has been left as it is: {err}"
+                             ,category=UserWarning,stacklevel=2)
+                runs[column] = {"path": "skipped", "error": f"{type(err).__name__}: {err}"}
+                continue
+
+            parsed_cols.append(parsed[col_parser._output_col()].alias(column))
+            if self.lenient:
+                parsed_cols.append(parsed[self.error_col].alias(f"{column}_{self.error_col}"))
+
+            runs[column] = col_parser.last_run
+
+        self.last_run = runs
+
+        return df.with_columns(parsed_cols)
+
+    def parse_ipc(self
+                 ,source : str | Path
+                 ,destination : str | Path
+                 ,date_column : str
+                 ,check_sorted : bool = True
+                 ) -> None:
+        """
+        Parse a date column from one Arrow IPC (Feather) file into another, for
+        handing frames between processes. The source is memory mapped and only
+        the date column is loaded; every other column is passed from the 
+        mapped source to the destination without being read into polars. The
+        output is uncompressed, so the next process can memory map it too.
+
+        Parameters:
+        - source: The IPC file to read.
+        - destination: The IPC file to write. It is written to a temporary file
+            and renamed into place, so it may be the same as `source`.
+        - date_column: The name of the column to parse.
+        - check_sorted: Whether to check if the column is sorted.
+        """
+
+        table = read_ipc_table(source)
+
+        if date_column not in table.column_names:
+            raise ValueError(f"Column {date_column} not found in {source}")
+
+        # The parse keeps the rows in order, so its columns can simply be put 
+        # alongside the untouched ones.
+        dates = pl.from_arrow(table.select([date_column]))
+        parsed = self(dates,date_column,check_sorted=check_sorted).to_arrow()
+
+        table = table.drop_columns([date_column])
+        for name, column in zip(parsed.column_names,parsed.columns):
+            table = table.append_column(name,column)
+
+        self._checkpoint("write",table.num_rows,table.num_rows)
+        write_ipc_table(table,destination)
+
+    def lock_format(self
+                   ,sample : pl.Series
+                   ) -> "Parser":
+        """
+        Decide how to parse a column up front, from a sample of it, and return a
+        copy of this parser that will parse every piece of that column the same
+        way. Useful when a column is spread over several sheets or files, each 
+        of which would otherwise make its own (possibly different) decision.
+
+        If a single strict format fits the sample, the copy has it as its 
+        'locked_format', and tries it on every piece without inferring it 
+        again. Unlike a 'date_format' the user passed in, a locked format is 
+        only a guess from the sample, so a piece with rows that don't fit it 
+        falls back on the component pipeline rather than raising. If no format
+        fits, the copy has the fast path turned off, so that every piece goes 
+        through the component pipeline.
+
+        Parameters:
+        - sample: Values drawn from every piece of the column.
+
+        Returns:
+        - A configured copy of this parser.
+        """
+
+        locked = copy.copy(self)
+
+        if sample.dtype != pl.Utf8:
+            return locked
+
+        fmt = self._dispatch_format(sample.to_frame("sample"),"sample")
+
+        if fmt is None:
+            locked.fast_path = False
+        else:
+            locked.locked_format = fmt
+
+        return locked
+
+    def _dispatch_format(self
+                        ,df : pl.DataFrame
+                        ,date_column : str
+                        ,month_col : int | None = None
+                        ) -> str | None:
+        """
+        Decide whether the column can skip the component pipeline. Returns the
+        strict format to parse it with, or None if it needs the full treatment.
+
+        If the user has given us a format, we trust it. If one was locked in by
+        `lock_format`, we try that. Otherwise we infer one from a sample of the
+        column, and only use it if exactly one of the formats consistent with 
+        our configuration fits. If the month was written as a name, `month_col`
+        is its position, and only the formats with the month there are tried -
+        whichever orders we've been told to allow, since the name settles it.
+        """
+
+        if self.date_format is not None:
+            return self.date_format
+
+        if not self.fast_path:
+            return None
+
+        if self.locked_format is not None:
+            return self.locked_format
+
+        known_month = month_col is not None
+
+        candidates = candidate_formats(self.mode
+                                      ,self.date_sep
+                                      ,self.time_sep
+                                      ,self.datetime_sep
+                                      ,allow_yearfirst=self.allow_yearfirst or known_month
+                                      ,allow_dayfirst=self.allow_dayfirst or known_month
+                                      ,allow_monthfirst=self.allow_monthfirst or known_month)
+
+        if known_month:
+            candidates = [
+                fmt for fmt in candidates
+                if re.findall(r"%[Ymd]",fmt).index("%m") == month_col
+            ]
+
+        return infer_strict_format(df[date_column],candidates,mode=self.mode)
+
+    def _parse_with_format(self
+                          ,df : pl.DataFrame
+                          ,date_column : str
+                          ,fmt : str
+                          ) -> pl.DataFrame | None:
+        """
+        Parse the column in one go with `str.to_datetime` (or `str.to_date`).
+
+        Returns None if any row doesn't fit the format - in which case the 
+        inference was fooled by its sample and we fall back on the component 
+        pipeline - unless the user gave us the format explicitly, in which case
+        the error is raised. In lenient mode a format the user gave us is 
+        trusted all the same, but rows that don't fit it come back as null with
+        a `BAD_COMPONENT` error rather than sinking the column.
+        """
+
+        user_format = fmt == self.date_format
+        strict = not (self.lenient and user_format)
 
-        # Get the column that we want to parse
         if self.mode == "datetime":
-            df = self._split_datetimes(df,datetime_col=date_column)
-            df = self._convert_time(df)
+            parsed = pl.col(date_column).str.to_datetime(fmt,time_unit=self.time_unit,strict=strict)
+            if self._output_dtype() == "date":
+                parsed = parsed.dt.date()
+        else:
+            parsed = pl.col(date_column).str.to_date(fmt,strict=strict)
+            if self._output_dtype() == "datetime":
+                parsed = parsed.cast(pl.Datetime(self.time_unit))
+
+        parsed = parsed.alias(self._output_col())
+
+        try:
+            df = df.with_columns(parsed)
+        except pl.exceptions.ComputeError:
+            if user_format:
+                raise
+            return None
+
+        if self.lenient:
+            df = df.with_columns(
+                pl.when(pl.col(date_column).is_null())
+                .then(ParseError.MISSING)
+                .when(pl.col(self._output_col()).is_null())
+                .then(ParseError.BAD_COMPONENT)
+                .otherwise(ParseError.OK)
+                .cast(pl.UInt8)
+                .alias(self.error_col)
+            )
 
-        df = self._split_dates(df,datetime_col=date_column)
+        return df.drop(date_column)
 
-        cols_to_process = self._get_cols_to_process(df,date_column)
-        max_chars_dict,max_val_dict = self._create_max_dicts(df,cols_to_process)
+    def _parse_excel_serial(self
+                           ,df : pl.DataFrame
+                           ,date_column : str
+                           ) -> pl.DataFrame:
+        """
+        Convert a float column of Excel serial dates (days since 1899-12-30, 
+        with the time of day as the fractional part) straight to a datetime, or
+        to a date in date mode.
+        """
+
+        if self._output_dtype() == "datetime":
+            units_per_day = NS_PER_DAY // NS_PER_UNIT[self.time_unit]
+            parsed = (
+                ((pl.col(date_column) - EXCEL_EPOCH_OFFSET) * units_per_day)
+                .round(0)
+                .cast(pl.Int64)
+                .cast(pl.Datetime(self.time_unit))
+            )
+        else:
+            parsed = (
+                (pl.col(date_column) - EXCEL_EPOCH_OFFSET)
+                .floor()
+                .cast(pl.Int32)
+                .cast(pl.Date)
+            )
+
+        parsed = parsed.alias(self._output_col())
+
+        df = df.with_columns(parsed)
+
+        if self.lenient:
+            df = df.with_columns(
+                pl.when(pl.col(date_column).is_null())
+                .then(ParseError.MISSING)
+                .otherwise(ParseError.OK)
+                .cast(pl.UInt8)
+                .alias(self.error_col)
+            )
+
+        return df.drop(date_column)
+
+    def _snap(self
+             ,df : pl.DataFrame
+             ) -> pl.DataFrame:
+        """
+        Round the parsed datetimes to the nearest multiple of `snap`, with 
+        integer arithmetic on their physical values. For "cadence" we round to
+        the second first, so that the drift doesn't upset the cadence 
+        detection, and then round to the detected frequency, counting from the
+        first timestamp so that e.g. a quarter hourly series starting at :05 
+        stays on :05, :20 and so on.
+
+        A date output has nothing to snap, and is returned as it is.
+        """
+
+        output_col = self._output_col()
+        if output_col != "Datetime":
+            return df
+
+        ns_per_unit = NS_PER_UNIT[self.time_unit]
+        physical = pl.col(output_col).cast(pl.Int64)
+
+        anchor = 0
+        step = SNAP_NS.get(self.snap,SNAP_NS["second"]) // ns_per_unit
+
+        if self.snap == "cadence":
+            seconds = df.select(
+                (((physical + step // 2) // step) * step).cast(pl.Datetime(self.time_unit)).alias(output_col)
+            )
+            frequency = detect_cadence(seconds,output_col,n_partitions=self.n_partitions).frequency
+            if frequency is not None:
+                step = (frequency // timedelta(microseconds=1)) * NS_PER_UNIT["us"] // ns_per_unit
+                anchor = seconds[output_col].drop_nulls().cast(pl.Int64)[0]
+
+        snapped = anchor + ((physical - anchor + step // 2) // step) * step
+        shift = (snapped - physical).abs()
+
+        rows_moved, max_shift = df.select((shift > 0).sum().alias("moved"),shift.max().alias("max")).row(0)
+
+        self.last_run["snap"] = {
+            "unit": self.snap,
+            "rows_moved": rows_moved,
+            "max_shift": timedelta(microseconds=(max_shift or 0) * ns_per_unit / NS_PER_UNIT["us"]),
+        }
+
+        return df.with_columns(snapped.cast(pl.Datetime(self.time_unit)).alias(output_col))
+
+    def _replace_names(self
+                      ,df : pl.DataFrame
+                      ,date_column : str
+                      ) -> tuple[pl.DataFrame,pl.DataFrame,int | None]:
+        """
+        Strip any leading weekday from the date column, and swap any month name
+        for its zero padded number, using vectorised lookups against the tables
+        in `locales`. After this the column can go down either path like any 
+        other numeric one.
+
+        Returns
+        -------
+        `tuple[pl.DataFrame,pl.DataFrame,int | None]`
+            The frame with the date column rewritten; a frame of the index and 
+            the ISO weekday each row started with (null if none); and the 
+            position of the month among the date components, if any rows had a
+            month name.
+
+        Raises
+        ------
+        `pl.exceptions.ComputeError`
+            If a row has a name we don't recognise, unless we're lenient - in 
+            which case the row is left alone to be flagged as malformed.
+        """
+
+        word = r"[^\W\d_]{2,}\.?"
+
+        raw = pl.col(date_column).str.strip_chars()
+
+        # A leading name is only a weekday if the rest of the row still has all
+        # three date components. Otherwise it's the month - which matters when
+        # a name is both, like "mar" (March, and mardi) in ["en","fr"].
+        rest = raw.str.replace(rf"^{word},?\s+","")
+        rest_date = rest
+        if self.mode == "datetime" and self.datetime_sep != self.date_sep:
+            rest_date = rest.str.splitn(self.datetime_sep,2).struct.field("field_0")
+        has_date = rest_date.str.count_matches(self.date_sep,literal=True) >= 2
+
+        weekday = (
+            pl.when(has_date)
+            .then(raw.str.extract(rf"^({word}),?\s+",1))
+            .str.strip_chars_end(".")
+            .str.to_lowercase()
+            .replace(weekday_lookup(self.locale),default=None,return_dtype=pl.UInt8)
+        )
+
+        df = df.with_columns(
+            weekday.alias("excellaint_weekday"),
+            pl.when(weekday.is_not_null())
+            .then(rest)
+            .otherwise(raw)
+            .alias(date_column),
+        )
+
+        parts = pl.col(date_column).str.extract_groups(rf"^(.*?)({word})(.*)$")
+        before, name, after = (parts.struct.field(str(group)) for group in (1, 2, 3))
+
+        month = (
+            name.str.strip_chars_end(".")
+            .str.to_lowercase()
+            .replace(month_lookup(self.locale),default=None,return_dtype=pl.UInt8)
+        )
+
+        df = df.with_columns(
+            month.alias("excellaint_month"),
+            name.is_not_null().alias("excellaint_has_name"),
+            before.str.count_matches(self.date_sep,literal=True).alias("excellaint_month_col"),
+        )
+
+        unknown = df["excellaint_has_name"] & df["excellaint_month"].is_null()
+        if unknown.any() and not self.lenient:
+            raise pl.exceptions.ComputeError(f"{unknown.sum()} rows have a name that isn't a month"
+                                             f" or weekday in locales {self.locale}")
+
+        month_col = df.filter(pl.col("excellaint_month").is_not_null())["excellaint_month_col"].mode()
+        month_col = int(month_col.min()) if month_col.len() else None
+
+        weekdays = df.select(self.index_col,"excellaint_weekday")
+
+        df = df.with_columns(
+            pl.when(pl.col("excellaint_month").is_not_null())
+            .then(pl.concat_str(before,pl.col("excellaint_month").cast(pl.Utf8).str.zfill(2),after))
+            .otherwise(pl.col(date_column))
+            .alias(date_column)
+        )
+
+        return df.drop("excellaint_weekday","excellaint_month","excellaint_has_name","excellaint_month_col"), weekdays, month_col
+
+    def _check_weekdays(self
+                       ,df : pl.DataFrame
+                       ,weekdays : pl.DataFrame
+                       ,date_column : str
+                       ) -> pl.DataFrame:
+        """
+        Check the parsed dates against the weekdays that were stripped off the 
+        front of them. Mismatched rows raise a warning - or in lenient mode are
+        nulled out, with a `WEEKDAY_MISMATCH` error code.
+        """
+
+        output_col = self._output_col()
+
+        df = df.join(weekdays,on=self.index_col,how="left",coalesce=True)
+        is_mismatch = (pl.col(output_col).dt.weekday() != pl.col("excellaint_weekday")).fill_null(False)
+
+        n_mismatches = df.select(is_mismatch.sum()).item()
+
+        if self.lenient:
+            df = df.with_columns(
+                pl.when(is_mismatch).then(None).otherwise(pl.col(output_col)).alias(output_col),
+                pl.when(is_mismatch & (pl.col(self.error_col) == ParseError.OK))
+                .then(ParseError.WEEKDAY_MISMATCH)
+                .otherwise(pl.col(self.error_col))
+                .cast(pl.UInt8)
+                .alias(self.error_col),
+            )
+        elif n_mismatches:
+            warnings.warn(f"{n_mismatches} rows of `{date_column}` fall on a different day of the week to the one"
+                          " they are labelled with."
+                         ,category=UserWarning,stacklevel=3)
+
+        return df.drop("excellaint_weekday")
+
+    def _parse_components(self
+                         ,df : pl.DataFrame
+                         ,date_column : str
+                         ,month_col : int | None = None
+                         ) -> tuple[pl.DataFrame,str,bool]:
+        """
+        The generic pipeline: split the column into its components, work out 
+        which is the year, month and day, and then build the date (and datetime)
+        back up from them. Used for columns which are genuinely mangled, or 
+        which mix several formats. If the month was given by name, `month_col`
+        is the position of the month component.
+
+        Returns the parsed frame, the engine that was actually used, and 
+        whether the split components came from the cache.
+        """
+
+        cache_key = None
+        cached = None
+        if self.cache is not None:
+            cache_key = self._cache_key(df,date_column)
+            cached = self.cache.get(cache_key)
+
+        if cached is not None:
+            df, (engine, max_chars_dict, max_val_dict) = cached
+        else:
+            df, engine, max_chars_dict, max_val_dict = self._tokenise(df,date_column)
+            self._checkpoint("tokenise",0,df.height)
+
+            if cache_key is not None:
+                self.cache.put(cache_key,df,(engine,max_chars_dict,max_val_dict))
+
+        cols_to_process = list(max_chars_dict)
 
         mappings = self._assign_datetype(max_chars_dict
                                         ,max_val_dict
-                                        ,cols_to_process)
+                                        ,cols_to_process
+                                        ,month_col=month_col)
 
 
         df = (df.rename(mappings)
                 .with_columns(
-                    pl.col("Day").cast(pl.Int32),
-                    pl.col("Month").cast(pl.Int32),
+                    pl.col("Day").cast(pl.UInt8,strict=not self.lenient),
+                    pl.col("Month").cast(pl.UInt8,strict=not self.lenient),
             )
         )
 
         df = self._year_to_int(df)
+
+        if self.lenient:
+            df = self._flag_out_of_range(df)
+
         df = self._combine_date_cols(df)
-        df = self._combine_datetime_cols(df)
 
-        if fix_datetime_sorting:
-            pass
+        if self._output_dtype() == "datetime":
+            df = self._combine_datetime_cols(df)
+        elif "Time" in df.columns:
+            df = df.drop("Time")
 
-        df = self._clean_index(df)
+        return df, engine, cached is not None
 
-        return df
+    def _tokenise(self
+                 ,df : pl.DataFrame
+                 ,date_column : str
+                 ) -> tuple[pl.DataFrame,str,dict[str,int],dict[str,int]]:
+        """
+        Break the date column up into its components, with whichever engine 
+        we've been asked for, and gather the statistics we use to work out which
+        component is which. This is everything in the component pipeline that 
+        doesn't depend on the day/month/year configuration, so it's the part we
+        cache.
+
+        Returns the frame of components, the engine that was actually used, and
+        the maximum width and value of each date component.
+        """
+
+        if self.lenient:
+            df = self._flag_malformed(df,date_column)
+
+        extracted = None
+        if self.engine == "fixed_width":
+            extracted = self._extract_fixed_width(df,date_column)
+
+        if extracted is not None:
+            df, max_chars_dict = extracted
+            max_val_dict = df.select(pl.col(list(max_chars_dict)).max()).row(0,named=True)
+            return df, "fixed_width", max_chars_dict, max_val_dict
+
+        # Get the column that we want to parse
+        if self.mode == "datetime":
+            df = self._split_datetimes(df,datetime_col=date_column)
+            df = self._convert_time(df)
+
+        df = self._split_dates(df,datetime_col=date_column)
+
+        cols_to_process = self._get_cols_to_process(df,date_column)
+        max_chars_dict,max_val_dict = self._create_max_dicts(df,cols_to_process)
+
+        return df, "split", max_chars_dict, max_val_dict
+
+    def _cache_key(self
+                  ,df : pl.DataFrame
+                  ,date_column : str
+                  ) -> tuple:
+        """
+        The component cache key: the contents of the column, plus every setting
+        that changes how it gets split.
+        """
+
+        return (
+            column_fingerprint(df[date_column]),
+            df.height,
+            self.mode,
+            self.date_sep,
+            self.time_sep,
+            self.datetime_sep,
+            self.engine,
+            self.lenient,
+        )
+
+    def _extract_fixed_width(self
+                            ,df : pl.DataFrame
+                            ,date_column : str
+                            ) -> tuple[pl.DataFrame,dict[str,int]] | None:
+        """
+        The fixed width engine's alternative to `_split_datetimes`, 
+        `_convert_time` and `_split_dates`. Reads the date components straight 
+        out of the column's Arrow buffers with `kernels.extract_fixed_width`, 
+        and builds the time from the time components.
+
+        Returns
+        -------
+        `tuple[pl.DataFrame,dict[str,int]] | None`
+            The frame with the date column replaced by integer date component 
+            columns "0", "1" and "2" (plus "Time" in datetime mode), and the 
+            width of each date component. None if the column isn't fixed width,
+            in which case we fall back on splitting it.
+        """
+
+        separators = list(dict.fromkeys([self.date_sep,self.time_sep,self.datetime_sep]))
+        extracted = extract_fixed_width(df[date_column],separators)
+
+        if extracted is None:
+            return None
+
+        components, widths = extracted
+        n_time = len(components) - 3
+
+        if self.mode == "date" and n_time != 0:
+            return None
+        if self.mode == "datetime" and n_time not in (2, 3):
+            return None
+
+        is_null = df[date_column].is_null()
+        date_cols = {
+            str(pos) : pl.Series(str(pos),components[pos]).set(is_null,None)
+            for pos in range(3)
+        }
+        df = df.drop(date_column).with_columns(**date_cols)
+
+        if self.mode == "datetime":
+            hour, minute = components[3].astype(np.int64), components[4].astype(np.int64)
+            second = components[5].astype(np.int64) if n_time == 3 else 0
+
+            time_ns = pl.Series("Time",(hour * 3600 + minute * 60 + second) * 1_000_000_000)
+            is_bad_time = pl.Series((hour > 23) | (minute > 59) | (second > 59)) & ~is_null
+
+            if is_bad_time.any() and not self.lenient:
+                raise pl.exceptions.ComputeError(f"{is_bad_time.sum()} rows have an impossible time")
+
+            df = df.with_columns(time_ns.set(is_bad_time | is_null,None).cast(pl.Time))
+
+        return df, {str(pos) : widths[pos] for pos in range(3)}
+
+    def _output_dtype(self) -> str:
+        """
+        The dtype we are building: whatever the user asked for, or else 
+        whatever the mode implies.
+        """
+        if self.output_dtype is not None:
+            return self.output_dtype
+        return "datetime" if self.mode == "datetime" else "date"
+
+    def _output_col(self) -> str:
+        """
+        The name of the parsed column in the output.
+        """
+        return "Datetime" if self._output_dtype() == "datetime" else "Date"
+
+    def _checkpoint(self
+                   ,stage : str
+                   ,rows_done : int
+                   ,rows_total : int
+                   ) -> None:
+        """
+        Called between stages: stop if we've been cancelled, and otherwise 
+        report the stage that just finished, and how many rows of the current
+        piece are done, to the progress callback.
+        """
+        if self.cancel is not None:
+            self.cancel.raise_if_cancelled()
+        if self.progress is not None:
+            self.progress(stage,self.piece,rows_done,rows_total)
 
     def set_time_vars(self
                      ,allow_times : bool
@@ -273,6 +1222,8 @@ class Parser():
 
         self._check_datetime_col_dtype(df,datetime_col)
 
+        index_cols = df.columns
+
         return (
             df
             .with_columns(
@@ -285,7 +1236,7 @@ class Parser():
                 .alias("col_nm")
             )
             .pivot(
-                index=[self.index_col,datetime_col],
+                index=index_cols,
                 values='[date,time]',
                 columns='col_nm',
             )
@@ -343,6 +1294,8 @@ class Parser():
         """
         self._check_datetime_col_dtype(df,datetime_col)
 
+        index_cols = df.columns
+
         return (
             df
             .with_columns(
@@ -355,9 +1308,7 @@ class Parser():
                 .alias("col_nm")
             )
             .pivot(
-                index=[self.index_col,datetime_col,'Time'],
-    # We can make this more robust in the future by working out all the columns other 
-    # than the column we want to split
+                index=index_cols,
                 values='[date]',
                 columns='col_nm',
             )
@@ -368,14 +1319,11 @@ class Parser():
                      ,df : pl.DataFrame
                      ) -> pl.DataFrame:
         """
-        Converts a string column in a DataFrame to a time object.
-
-        This function takes a DataFrame and a column named "time_str" containing time strings. 
-        It converts the time strings into time objects using the specified format ("%H{self.time_sep}%M"), 
-        and replaces the original "time_str" column with the new "Time" column containing time objects.
+        Converts the "time_str" column in a DataFrame to a "Time" column.
 
-        The function currently only works on string columns. If the "time_str" column is not 
-        of string type, a TypeError will be raised by the underlying Polars library.
+        Times can be "%H:%M", "%H:%M:%S" or have fractional seconds after 
+        that - as Excel produces when a time has drifted, e.g. '10:59:59.999' -
+        with `self.time_sep` in place of the colons.
 
         Parameters
         ----------
@@ -389,29 +1337,139 @@ class Parser():
 
         Raises
         ------
-        `TypeError`
-             - If df is not a DataFrame.
-             - If the "time_str" column is not of string type.
+        `pl.exceptions.ComputeError`
+             - If any time doesn't fit one of the formats, or is impossible 
+             (e.g. '25:00'), unless we're lenient - in which case it comes out
+             as null.
+        """
 
-        Notes
-        -----
-        The time format ("%H{self.time_sep}%M") is hardcoded in the function. 
-        This means that the function currently only works with time strings in this specific format.
+        is_bad = pl.col("time_str").is_not_null() & pl.col("Time").is_null()
+
+        # Most columns don't have seconds, so try the cheaper format first and
+        # only go back for the rest if some rows didn't fit it.
+        df = df.with_columns(
+            pl.col("time_str").str.to_time(f"%H{self.time_sep}%M",strict=False).alias("Time")
+        )
+
+        if df.select(is_bad.any()).item():
+            with_seconds = pl.col("time_str").str.to_time(f"%H{self.time_sep}%M{self.time_sep}%S%.f",strict=False)
+            df = df.with_columns(pl.coalesce("Time",with_seconds).alias("Time"))
+
+        if not self.lenient:
+            n_bad = df.select(is_bad.sum()).item()
+            if n_bad:
+                raise pl.exceptions.ComputeError(f"{n_bad} rows have a time that isn't in a supported format")
+
+        return df.drop("time_str")
+
+    def _flag_malformed(self
+                       ,df : pl.DataFrame
+                       ,datetime_col : str
+                       ) -> pl.DataFrame:
         """
+        Works out which rows of the datetime column can't possibly be parsed, 
+        before we try to split them, and records why in the error column. Those
+        rows are then set to null, so that they don't upset the statistics we 
+        use to work out which component is which, or the casts that follow.
+
+        Only used in lenient mode.
+
+        Parameters
+        ----------
+        `df` : pl.DataFrame
+            The DataFrame containing the datetime column to check.
+        `datetime_col` : str
+            The name of the datetime column.
+
+        Returns
+        -------
+        `pl.DataFrame`
+            The DataFrame with malformed rows nulled out and an error column 
+            added.
+        """
+
+        self._check_datetime_col_dtype(df,datetime_col)
+
+        date_sep = re.escape(self.date_sep)
+        time_sep = re.escape(self.time_sep)
+        date_pattern = rf"^\d{{1,4}}{date_sep}\d{{1,4}}{date_sep}\d{{1,4}}$"
+        time_pattern = rf"^\d{{1,2}}{time_sep}\d{{2}}(?:{time_sep}\d{{2}}(?:\.\d{{1,9}})?)?$"
+
+        raw = pl.col(datetime_col)
+
+        if self.mode == "datetime":
+            parts = raw.str.splitn(self.datetime_sep,2)
+            date_part = parts.struct.field("field_0")
+            time_part = parts.struct.field("field_1")
+            bad_datetime_sep = raw.str.count_matches(self.datetime_sep,literal=True) != 1
+            bad_time = ~time_part.str.contains(time_pattern)
+        else:
+            date_part = raw
+            bad_datetime_sep = pl.lit(False)
+            bad_time = pl.lit(False)
+
+        error_code = (
+            pl.when(raw.is_null()).then(ParseError.MISSING)
+            .when(bad_datetime_sep).then(ParseError.BAD_SEPARATOR)
+            .when(date_part.str.count_matches(self.date_sep,literal=True) != 2)
+            .then(ParseError.BAD_SEPARATOR)
+            .when(~date_part.str.contains(date_pattern)).then(ParseError.BAD_COMPONENT)
+            .when(bad_time).then(ParseError.BAD_TIME)
+            .otherwise(ParseError.OK)
+            .cast(pl.UInt8)
+            .alias(self.error_col)
+        )
 
         return (
-            df.with_columns(
-                pl.col("time_str")
-                .str
-                .to_time(f"%H{self.time_sep}%M")
-                .alias("Time")
+            df
+            .with_columns(error_code)
+            .with_columns(
+                pl.when(pl.col(self.error_col) == ParseError.OK)
+                .then(raw)
+                .alias(datetime_col)
             )
         )
 
+    def _flag_out_of_range(self
+                          ,df : pl.DataFrame
+                          ) -> pl.DataFrame:
+        """
+        Once we know which component is which, flag the rows whose month or day 
+        can't exist (or whose time didn't parse), and null them out so they 
+        don't make it into the final date. Rows that were already flagged keep 
+        their original error code.
+
+        Only used in lenient mode.
+        """
+
+        days_in_month = _days_in_month(pl.col("Year"),pl.col("Month"))
+
+        bad_time = pl.lit(False)
+        if "Time" in df.columns:
+            bad_time = pl.col("Time").is_null()
+
+        df = df.with_columns(
+            pl.when(pl.col(self.error_col) != ParseError.OK).then(pl.col(self.error_col))
+            .when(~pl.col("Month").is_between(1,12).fill_null(False)).then(ParseError.MONTH_OUT_OF_RANGE)
+            .when(~pl.col("Day").is_between(1,days_in_month).fill_null(False)).then(ParseError.INVALID_DAY)
+            .when(bad_time).then(ParseError.BAD_TIME)
+            .otherwise(ParseError.OK)
+            .cast(pl.UInt8)
+            .alias(self.error_col)
+        )
+
+        is_ok = pl.col(self.error_col) == ParseError.OK
+
+        return df.with_columns(
+            pl.when(is_ok).then(pl.col(col)).alias(col)
+            for col in ["Year","Month","Day","Time"] if col in df.columns
+        )
+
     def _assign_datetype(self
                         ,max_chars_dict : dict[str,int]
                         ,max_val_dict : dict[str,int]
                         ,cols_to_process : list[str]
+                        ,month_col : int | None = None
                         ) -> dict[str,str]:
         """
         This function takes the columns to process, the maximum number of characters
@@ -420,6 +1478,11 @@ class Parser():
             - Year 
             - Month
             - Day
+
+        If we already know which column is the month (because it was written as
+        a name), the year is the four character column - or, for two digit 
+        years, whichever of the other two comes last - and the day is what's 
+        left.
         """
         available_date_data_types = { 
             "Year",
@@ -433,20 +1496,29 @@ class Parser():
             "Day" : None,
         }
 
-        for key, val in max_chars_dict.items():
-            if val == 4:
-                mappings["Year"] = int(key)
-                available_date_data_types.remove("Year")
+        if month_col is not None:
+            others = [int(key) for key in max_chars_dict if int(key) != month_col]
+            four_chars = [col for col in others if max_chars_dict[str(col)] == 4]
+
+            mappings["Month"] = month_col
+            mappings["Year"] = four_chars[0] if four_chars else max(others)
+            mappings["Day"] = next(col for col in others if col != mappings["Year"])
+            available_date_data_types.clear()
+        else:
+            for key, val in max_chars_dict.items():
+                if val == 4:
+                    mappings["Year"] = int(key)
+                    available_date_data_types.remove("Year")
 
-                if not self.allow_monthfirst:
-                    mappings["Day"] = 2 - mappings["Year"]
-                    mappings["Month"] = 1
+                    if not self.allow_monthfirst:
+                        mappings["Day"] = 2 - mappings["Year"]
+                        mappings["Month"] = 1
 
-                    available_date_data_types.remove("Day")
-                    available_date_data_types.remove("Month")
-                    break
-                else:
-                    raise NotImplementedError("Only an instance with a four digit year is supported at the moment.")
+                        available_date_data_types.remove("Day")
+                        available_date_data_types.remove("Month")
+                        break
+                    else:
+                        raise NotImplementedError("Only an instance with a four digit year is supported at the moment.")
 
 
         if len(available_date_data_types) > 0:
@@ -483,13 +1555,27 @@ class Parser():
 
         CURRENT_YEAR = date.today().year
 
+        strict = not self.lenient
+
+        if df.schema[year_col] != pl.Utf8:
+            # The fixed width engine hands us the year as an integer already, 
+            # so we just need the same century logic as below.
+            year = pl.col(year_col).cast(pl.Int32)
+            return df.with_columns(
+                pl.when(year >= 100).then(year)
+                .when(year <= CURRENT_YEAR).then(year + 2000)
+                .otherwise(year + 1900)
+                .cast(pl.UInt16,strict=strict)
+                .alias(year_col)
+            )
+
         df = df.with_columns(
             pl.col("Year").str.len_chars().alias("year_len")
         )
 
         df = df.with_columns(
             pl.when(pl.col("year_len") == 4)
-            .then(pl.col("Year").cast(pl.Int32))
+            .then(pl.col("Year").cast(pl.Int32,strict=strict))
             .otherwise(
                 pl.col("Year")
             ).alias("Year")
@@ -498,7 +1584,7 @@ class Parser():
         df = df.with_columns(
             pl.when(pl.col("year_len") == 2)
             .then(
-                pl.when(pl.col("Year").cast(pl.Int32) <= CURRENT_YEAR)
+                pl.when(pl.col("Year").cast(pl.Int32,strict=strict) <= CURRENT_YEAR)
                 .then(pl.lit("20"))
                 .otherwise(pl.lit("19"))
             )
@@ -508,57 +1594,66 @@ class Parser():
 
         df = df.with_columns(
             (pl.col("prepend_col") + pl.col("Year").alias("Year"))
-            .cast(pl.Int32)
+            .cast(pl.Int32,strict=strict)
             .alias("Year")
         )
 
         df = df.drop("year_len","prepend_col")
 
         return df.with_columns(
-            pl.col(year_col).cast(pl.Int32)
+            pl.col(year_col).cast(pl.UInt16,strict=strict)
         )
 
     def _combine_date_cols(self
                           ,df : pl.DataFrame
                           ) -> pl.DataFrame:
         """
-        This function takes a dataframe with date columns and a time column and 
-        combines them into a datetime column. Since the names are all set by the 
+        This function takes a dataframe with Year, Month and Day columns and 
+        combines them into a date column. Since the names are all set by the 
         previous functions we can keep things really constrained
 
+        The date is built as a count of days since the epoch with integer 
+        arithmetic, rather than going through `pl.date`. Days that don't exist 
+        (e.g. the 31st of February) come out as null.
         """
 
+        year, month, day = pl.col("Year"), pl.col("Month"), pl.col("Day")
+
+        is_valid = (
+            month.is_between(1,12)
+            & day.is_between(1,_days_in_month(year,month))
+        )
+
         df = df.with_columns(
-            pl.date(
-                pl.col("Year"),
-                pl.col("Month"),
-                pl.col("Day"),
-            ).alias("Date")
+            pl.when(is_valid)
+            .then(_days_from_civil(year,month,day))
+            .cast(pl.Date)
+            .alias("Date")
             )
 
-        return df
+        return df.drop("Year","Month","Day")
 
     def _combine_datetime_cols(self
                               ,df : pl.DataFrame
                               ) -> pl.DataFrame:
         """
-        Combine our date and our time column
+        Combine our date and our time column. Both are integers underneath - 
+        days since the epoch and nanoseconds since midnight - so we just scale
+        them to `time_unit` and add them up. If there's no time column (i.e. in
+        date mode) we get midnight.
         """
 
+        ns_per_unit = NS_PER_UNIT[self.time_unit]
+
+        datetime_col = pl.col("Date").cast(pl.Int64) * (NS_PER_DAY // ns_per_unit)
+        if "Time" in df.columns:
+            datetime_col = datetime_col + pl.col("Time").cast(pl.Int64) // ns_per_unit
+
         df = df.with_columns(
-            pl.datetime(
-                pl.col("Date").dt.year(),
-                pl.col("Date").dt.month(),
-                pl.col("Date").dt.day(),
-                pl.col("Time").dt.hour(),
-                pl.col("Time").dt.minute(),
-                pl.col("Time").dt.second(),
-            ).alias("Datetime")
+            datetime_col.cast(pl.Datetime(self.time_unit)).alias("Datetime")
             )
 
-        df= df.drop("Date","Time","Year","Month","Day")
-
-        return df
+        return df.drop(*[col for col in ["Date","Time"] if col in df.columns])
 
     def _get_cols_to_process(self
                             ,df : pl.DataFrame
@@ -592,7 +1687,7 @@ class Parser():
 
 
         max_val_dict = processing_df.with_columns(
-            [pl.col(colname).cast(pl.Int32).max() for colname in cols_to_process]
+            [pl.col(colname).cast(pl.Int32,strict=not self.lenient).max() for colname in cols_to_process]
         ).max().to_dict(as_series=False)
 
         max_val_dict = {
@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import polars as pl
+
+"""
+Row-partitioned execution of order-dependent stages.
+
+Most of the parser is a handful of polars expressions, which polars already
+spreads across every core. A few stages can't be written that way because each
+row depends on its neighbours - the sort check, and the step between
+consecutive timestamps that cadence detection is built on - and these run over
+the whole column on a single core.
+
+The helpers here split a column into contiguous row partitions and run such a
+stage over each of them in a thread pool. Every partition is handed a small
+"halo" of the rows just before it, so that the rows at the start of a partition
+can still see their neighbours, and the per-partition results are then stitched
+back together in order. The stitched result is exactly what running the stage
+over the whole column gives.
+"""
+
+
+def partition_bounds(n_rows : int
+                    ,n_partitions : int
+                    ) -> list[tuple[int,int]]:
+    """
+    Split `n_rows` rows into at most `n_partitions` contiguous, near equal
+    partitions. Returns a (start, length) pair for each non-empty partition.
+    """
+
+    if n_partitions < 1:
+        raise ValueError(f"n_partitions must be at least 1. Got: {n_partitions}")
+
+    n_partitions = max(1, min(n_partitions, n_rows))
+    size, extra = divmod(n_rows, n_partitions)
+
+    bounds = []
+    start = 0
+    for i in range(n_partitions):
+        length = size + (i < extra)
+        bounds.append((start, length))
+        start += length
+
+    return bounds
+
+
+def map_partitions(series : pl.Series
+                  ,func : Callable[[pl.Series,int],Any]
+                  ,n_partitions : int
+                  ,halo : int = 0
+                  ) -> list[Any]:
+    """
+    Run `func` over contiguous row partitions of a column in a thread pool.
+
+    Parameters
+    ----------
+    `series` : pl.Series
+        The column to partition.
+    `func` : Callable[[pl.Series,int],Any]
+        Called with each partition, extended backwards by up to `halo` rows,
+        and the number of halo rows it was actually given (which is fewer for
+        the first partition).
+    `n_partitions` : int
+        The number of partitions, and of threads.
+    `halo` : int, optional
+        How many of the preceding rows each partition needs to see. Defaults
+        to 0.
+
+    Returns
+    -------
+    `list[Any]`
+        The result of `func` for each partition, in row order.
+    """
+
+    bounds = partition_bounds(series.len(),n_partitions)
+
+    def run(bound : tuple[int,int]) -> Any:
+        start, length = bound
+        n_halo = min(halo, start)
+        return func(series.slice(start - n_halo, length + n_halo), n_halo)
+
+    if len(bounds) == 1:
+        return [run(bounds[0])]
+
+    with ThreadPoolExecutor(max_workers=len(bounds)) as pool:
+        return list(pool.map(run,bounds))
+
+
+def is_sorted(series : pl.Series
+             ,n_partitions : int = 1
+             ) -> bool:
+    """
+    Whether a column is sorted in ascending order (nulls first), checked over
+    row partitions in parallel. Each partition overlaps the one before it by a
+    row, so between them they check every consecutive pair of rows.
+    """
+
+    if n_partitions == 1:
+        return series.is_sorted()
+
+    return all(map_partitions(series,lambda part, _: part.is_sorted(),n_partitions,halo=1))
+
+
+def diff(series : pl.Series
+        ,n_partitions : int = 1
+        ) -> pl.Series:
+    """
+    The difference between consecutive values of a column, computed over row
+    partitions in parallel. The result is identical to `series.diff()`.
+    """
+
+    if n_partitions == 1:
+        return series.diff()
+
+    parts = map_partitions(series
+                          ,lambda part, n_halo: part.diff().slice(n_halo)
+                          ,n_partitions
+                          ,halo=1)
+
+    return pl.concat(parts,rechunk=False)
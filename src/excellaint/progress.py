@@ -0,0 +1,53 @@
+import threading
+from typing import Callable
+
+"""
+Progress reporting and cooperative cancellation.
+
+A parse of tens of millions of rows can take a while, and an orchestrator
+needs to know how far along it is and to be able to stop it without killing
+the worker. A `Parser` can be given a progress callback, which it calls as
+`progress(stage, piece, rows_done, rows_total)` as each stage finishes, and a
+`CancellationToken`, which it checks at the same points. Cancelling raises
+`ParseCancelled` at the next check, so a run stops at the end of whichever
+stage it is in; outputs are only ever renamed into place once complete, so a
+cancelled run never leaves a partial file behind.
+
+The multi-sheet, dataset and IPC modes all go through the same parser, so the
+callback and token apply to them too. Those run their pieces in threads, so the
+callback may be called from several threads at once, and `piece` says which
+sheet or file each call is about (it is None for a lone frame, and for the
+"sample" stage, which covers every piece). `rows_done` counts the rows of that
+piece that are finished, out of its `rows_total`, so an orchestrator can add
+them up across pieces. A piece is parsed in one go rather than in chunks, so
+its rows are all finished at once, at its "done" stage.
+"""
+
+ProgressCallback = Callable[[str,str | None,int,int],None]
+
+
+class ParseCancelled(Exception):
+    """
+    Raised when a parse stops because its `CancellationToken` was cancelled.
+    """
+
+
+class CancellationToken():
+    def __init__(self):
+        """
+        A flag which one thread can set to ask a parse running in another to
+        stop. One token can be shared between any number of parsers.
+        """
+
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise ParseCancelled("The parse was cancelled")
@@ -0,0 +1,228 @@
+import re
+from itertools import permutations
+
+import polars as pl
+
+from .formats import candidate_formats, infer_strict_format
+
+"""
+Discovery of date-like columns.
+
+Vendor sheets can have hundreds of columns with names that change from file to
+file, so asking for the name of the date column up front doesn't scale. The
+scanner here samples every string and float column in a frame, scores how
+date-like each one looks using a handful of cheap vectorised checks, and
+reports the candidates along with the configuration needed to parse them.
+
+Only a fixed size, evenly spaced sample of each column is ever looked at, so the
+cost of a scan doesn't grow with the number of rows.
+"""
+
+DATE_SEPS = ["/", "-", "."]
+TIME_SEP = ":"
+
+# Serials for 1950-01-01 and 2100-01-01 - anything outside this range is much
+# more likely to be a measurement than a date.
+SERIAL_MIN = 18264
+SERIAL_MAX = 73051
+
+MINUTES_PER_DAY = 1440
+
+# The largest step between consecutive rows we'll believe of a date column, in
+# days. Anything sparser is much more likely to be a list of amounts.
+MAX_STEP_DAYS = 366
+
+SCAN_SCHEMA = {
+    "column" : pl.Utf8,
+    "dtype" : pl.Utf8,
+    "score" : pl.Float64,
+    "mode" : pl.Utf8,
+    "date_sep" : pl.Utf8,
+    "datetime_sep" : pl.Utf8,
+    "format" : pl.Utf8,
+}
+
+
+def _date_pattern(date_sep : str) -> str:
+    sep = re.escape(date_sep)
+    return rf"^\d{{1,4}}{sep}\d{{1,2}}{sep}\d{{1,4}}(?:[ T]\d{{1,2}}:\d{{2}}(?::\d{{2}}(?:\.\d+)?)?)?$"
+
+
+def _plausible_dates(sample : pl.Series
+                    ,date_sep : str
+                    ) -> pl.Series:
+    """
+    Which values of a string sample have three date components that could be a
+    year (two or four digits), a month (1 to 12) and a day (1 to 31), in some
+    order. The shape alone lets through things like version numbers ("1.2.3").
+    """
+
+    sep = re.escape(date_sep)
+    parts = sample.str.extract_groups(rf"^(\d{{1,4}}){sep}(\d{{1,2}}){sep}(\d{{1,4}})")
+    components = [parts.struct.field(str(group)) for group in (1, 2, 3)]
+
+    is_year = [part.str.len_chars().is_in([2,4]) for part in components]
+    values = [part.cast(pl.Int32) for part in components]
+    is_month = [value.is_between(1,12) for value in values]
+    is_day = [value.is_between(1,31) for value in values]
+
+    plausible = pl.Series([False] * sample.len())
+    for year, month, day in permutations(range(3)):
+        plausible = plausible | (is_year[year] & is_month[month] & is_day[day])
+
+    return plausible.fill_null(False)
+
+
+def _sample(series : pl.Series
+           ,sample_size : int
+           ) -> pl.Series:
+    """
+    Take an evenly spaced sample of at most `sample_size` non-null values. The
+    gather happens before dropping nulls, so we never touch the whole column.
+    """
+    return series.gather_every(max(1, series.len() // sample_size)).drop_nulls()
+
+
+def _scan_strings(sample : pl.Series
+                 ,allow_yearfirst : bool
+                 ,allow_dayfirst : bool
+                 ,allow_monthfirst : bool
+                 ) -> dict | None:
+    """
+    Score a sample of a string column: the fraction of values that look like
+    a date with a consistent separator, and whose components could be a year,
+    a month and a day.
+    """
+
+    scores = {
+        date_sep : (sample.str.contains(_date_pattern(date_sep)) & _plausible_dates(sample,date_sep)).mean()
+        for date_sep in DATE_SEPS
+    }
+    date_sep = max(scores, key=scores.get)
+    score = scores[date_sep]
+
+    if not score:
+        return None
+
+    has_time = sample.str.contains(r"\d:\d{2}").mean() > 0.5
+    mode = "datetime" if has_time else "date"
+
+    datetime_sep = " "
+    if has_time and sample.str.contains(r"\dT\d").mean() > 0.5:
+        datetime_sep = "T"
+
+    candidates = candidate_formats(mode
+                                  ,date_sep
+                                  ,TIME_SEP
+                                  ,datetime_sep
+                                  ,allow_yearfirst=allow_yearfirst
+                                  ,allow_dayfirst=allow_dayfirst
+                                  ,allow_monthfirst=allow_monthfirst)
+
+    return {
+        "score" : score,
+        "mode" : mode,
+        "date_sep" : date_sep,
+        "datetime_sep" : datetime_sep,
+        "format" : infer_strict_format(sample,candidates,mode=mode,sample_size=sample.len()),
+    }
+
+
+def _scan_floats(sample : pl.Series
+                ,stride : int
+                ) -> dict | None:
+    """
+    Score a sample of a float column, taken every `stride` rows. Plenty of 
+    amounts (prices, salaries) fall in the range of Excel date serials, so a 
+    value only counts if it is in range and on a minute grid (to within a 
+    second, for Excel's drift), and the score is then scaled by how many of 
+    the steps between sampled values are the most common one. That step, per 
+    row, has to be no more than `MAX_STEP_DAYS`.
+    """
+
+    minutes = sample * MINUTES_PER_DAY
+    on_grid = (minutes - minutes.round(0)).abs() < 1 / 60
+    in_range = sample.is_between(SERIAL_MIN,SERIAL_MAX) & on_grid
+
+    steps = minutes.diff().drop_nulls().round(0)
+    moving = steps.filter(steps != 0)
+    if moving.len() == 0:
+        return None
+
+    step = moving.mode().min()
+    if abs(step) / MINUTES_PER_DAY / stride > MAX_STEP_DAYS:
+        return None
+
+    score = in_range.mean() * (steps == step).mean()
+
+    if not score:
+        return None
+
+    has_time = (sample != sample.floor()).any()
+
+    return {
+        "score" : score,
+        "mode" : "datetime" if has_time else "date",
+        "date_sep" : None,
+        "datetime_sep" : None,
+        "format" : "excel_serial",
+    }
+
+
+def find_date_columns(df : pl.DataFrame
+                     ,sample_size : int = 1000
+                     ,min_score : float = 0.8
+                     ,allow_yearfirst : bool = True
+                     ,allow_dayfirst : bool = True
+                     ,allow_monthfirst : bool = False
+                     ) -> pl.DataFrame:
+    """
+    Scan a frame for columns that look like they hold dates.
+
+    Parameters
+    ----------
+    `df` : pl.DataFrame
+        The frame to scan. Only string and float columns are considered.
+    `sample_size` : int, optional
+        The maximum number of values to look at in each column. Defaults to
+        1000.
+    `min_score` : float, optional
+        The fraction of sampled values that must look like a date for a column
+        to be reported. Defaults to 0.8.
+    `allow_yearfirst`, `allow_dayfirst`, `allow_monthfirst` : bool, optional
+        The component orders to consider when inferring a strict format. These
+        mean the same as they do on `Parser`.
+
+    Returns
+    -------
+    `pl.DataFrame`
+        One row per candidate column, best first, with its score and the
+        `mode`, `date_sep` and `datetime_sep` to parse it with. `format` is the
+        strict format the column is in, "excel_serial" for float columns of
+        Excel serial dates, or null if the column is mangled and needs the full
+        component pipeline.
+    """
+
+    if not isinstance(df, pl.DataFrame):
+        raise TypeError("df must be a polars DataFrame")
+
+    rows = []
+    for colname, dtype in df.schema.items():
+        if dtype == pl.Utf8:
+            sample = _sample(df[colname],sample_size)
+            found = _scan_strings(sample,allow_yearfirst,allow_dayfirst,allow_monthfirst)
+        elif dtype in (pl.Float32, pl.Float64):
+            sample = _sample(df[colname],sample_size)
+            found = _scan_floats(sample,max(1, df.height // sample_size))
+        else:
+            continue
+
+        if found is None or found["score"] < min_score:
+            continue
+
+        rows.append({"column" : colname, "dtype" : str(dtype), **found})
+
+    return (
+        pl.DataFrame(rows,schema=SCAN_SCHEMA)
+        .sort("score",descending=True,maintain_order=True)
+    )
@@ -0,0 +1,221 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+
+from .kernels import ASCII_ZERO
+
+"""
+Synthetic mangled date columns, for load and accuracy testing.
+
+The fixtures in `test/test_data` are a couple of small files. To see how the
+parser copes with tens of millions of rows, and with the particular ways Excel
+mangles dates, `generate_mangled` builds a regular datetime series and renders
+it as strings with a configurable share of rows mangled in each of those ways.
+The strings are written digit by digit into a NumPy byte buffer (the reverse
+of what `kernels` does when reading them) using seeded masks, so a 10M row
+column takes a few seconds and the same seed always gives the same column. The
+true timestamps come back alongside, and `write_mangled` writes both out to
+CSV, Parquet or xlsx.
+"""
+
+MANGLED_COL = "mangled_dates"
+TRUTH_COL = "truth"
+
+# The most rows an xlsx sheet can hold, less one for the header
+XLSX_MAX_ROWS = 1_048_575
+
+NOISE_SEPS = ["-", "."]
+
+
+def generate_mangled(n_rows : int
+                    ,start : datetime = datetime(2000,1,1)
+                    ,frequency : timedelta = timedelta(hours=1)
+                    ,seed : int = 0
+                    ,mdy_swap : float = 0.0
+                    ,two_digit_year : float = 0.0
+                    ,midnight_as_noon : float = 0.0
+                    ,dropped_time : float = 0.0
+                    ,serial : float = 0.0
+                    ,separator_noise : float = 0.0
+                    ,date_sep : str = "/"
+                    ,time_sep : str = ":"
+                    ,datetime_sep : str = " "
+                    ) -> pl.DataFrame:
+    """
+    Generate a column of regularly spaced datetimes, rendered as day first
+    strings ("%d/%m/%Y %H:%M") with a share of the rows mangled.
+
+    Parameters
+    ----------
+    `n_rows` : int
+        The number of rows.
+    `start` : datetime, optional
+        The first timestamp. Defaults to 2000-01-01.
+    `frequency` : timedelta, optional
+        The step between timestamps. Defaults to an hour.
+    `seed` : int, optional
+        Seeds which rows get mangled. Defaults to 0.
+    `mdy_swap` : float, optional
+        The share of rows written month first, as if by an American Excel.
+    `two_digit_year` : float, optional
+        The share of rows with a two digit year. The parser reads these as
+        20xx up to the current year, so keep the truth in that range if you 
+        want them to round trip.
+    `midnight_as_noon` : float, optional
+        The share of midnight rows written as "12:00" rather than "00:00".
+    `dropped_time` : float, optional
+        The share of midnight rows written without a time at all.
+    `serial` : float, optional
+        The share of rows written as an Excel serial number, as happens when a
+        column mixes dates and numbers.
+    `separator_noise` : float, optional
+        The share of rows with "-" or "." in place of `date_sep`.
+    `date_sep`, `time_sep`, `datetime_sep` : str, optional
+        The single character separators of the unmangled rows. Default to "/",
+        ":" and " ".
+
+    Returns
+    -------
+    `pl.DataFrame`
+        The strings in a "mangled_dates" column, and the timestamps they came
+        from in a "truth" column.
+
+    Raises
+    ------
+    `ValueError`
+        If any of the shares isn't between 0 and 1, or a separator isn't a
+        single character.
+    """
+
+    shares = {
+        "mdy_swap" : mdy_swap,
+        "two_digit_year" : two_digit_year,
+        "midnight_as_noon" : midnight_as_noon,
+        "dropped_time" : dropped_time,
+        "serial" : serial,
+        "separator_noise" : separator_noise,
+    }
+    for name, share in shares.items():
+        if not 0 <= share <= 1:
+            raise ValueError(f"{name} must be between 0 and 1. Got: {share}")
+
+    for name, sep in {"date_sep" : date_sep, "time_sep" : time_sep, "datetime_sep" : datetime_sep}.items():
+        if len(sep) != 1:
+            raise ValueError(f"{name} must be a single character. Got: {sep!r}")
+
+    rng = np.random.default_rng(seed)
+    masks = {name : rng.random(n_rows) < share for name, share in shares.items()}
+
+    # Build the truth with integer arithmetic, rather than a calendar aware
+    # `datetime_range`, which is slow and hungry for this many rows.
+    start_us = (start - datetime(1970,1,1)) // timedelta(microseconds=1)
+    step_us = frequency // timedelta(microseconds=1)
+    truth = (
+        (pl.int_range(0,n_rows,dtype=pl.Int64,eager=True) * step_us + start_us)
+        .cast(pl.Datetime("us"))
+        .alias(TRUTH_COL)
+    )
+
+    parts = truth.to_frame().select(
+        pl.col(TRUTH_COL).dt.year().alias("year"),
+        pl.col(TRUTH_COL).dt.month().alias("month"),
+        pl.col(TRUTH_COL).dt.day().alias("day"),
+        pl.col(TRUTH_COL).dt.hour().alias("hour"),
+        pl.col(TRUTH_COL).dt.minute().alias("minute"),
+    )
+    year, month, day, hour, minute = (parts[col].to_numpy().astype(np.int16) for col in parts.columns)
+
+    is_midnight = (hour == 0) & (minute == 0)
+    hour = np.where(masks["midnight_as_noon"] & is_midnight,12,hour)
+    is_dropped = masks["dropped_time"] & is_midnight
+    is_short_year = masks["two_digit_year"]
+    year = np.where(is_short_year,year % 100,year)
+
+    first = np.where(masks["mdy_swap"],month,day)
+    second = np.where(masks["mdy_swap"],day,month)
+
+    seps = np.full(n_rows,ord(date_sep),dtype=np.uint8)
+    noise = np.frombuffer("".join(NOISE_SEPS).encode(),dtype=np.uint8)
+    seps = np.where(masks["separator_noise"],noise[rng.integers(0,len(noise),n_rows)],seps)
+
+    # Every string is written into a fixed width row of bytes - DD/MM/YYYY HH:MM
+    # - with the year written from the left, and the bytes a row doesn't use
+    # (the end of a two digit year, or a dropped time) masked out.
+    def digits(values : np.ndarray, width : int) -> list[np.ndarray]:
+        return [(values // 10 ** (width - 1 - k) % 10 + ASCII_ZERO).astype(np.uint8) for k in range(width)]
+
+    short_year = digits(year,2)
+    long_year = digits(year,4)
+    year_bytes = [np.where(is_short_year,short_year[k],long_year[k]) for k in range(2)] + long_year[2:]
+
+    columns = [
+        *digits(first,2), seps,
+        *digits(second,2), seps,
+        *year_bytes,
+        np.full(n_rows,ord(datetime_sep),dtype=np.uint8),
+        *digits(hour,2),
+        np.full(n_rows,ord(time_sep),dtype=np.uint8),
+        *digits(minute,2),
+    ]
+    chars = np.stack(columns,axis=1)
+
+    keep = np.ones(chars.shape,dtype=bool)
+    keep[:,8:10] = ~is_short_year[:,None]
+    keep[:,10:] = ~is_dropped[:,None]
+
+    offsets = np.zeros(n_rows + 1,dtype=np.int64)
+    np.cumsum(keep.sum(axis=1),out=offsets[1:])
+
+    arr = pa.Array.from_buffers(pa.large_string()
+                               ,n_rows
+                               ,[None, pa.py_buffer(offsets), pa.py_buffer(chars[keep])])
+    mangled = pl.Series(MANGLED_COL,arr)
+
+    # Serials count days (and fractions of days) since 1899-12-30
+    serial_rows = np.flatnonzero(masks["serial"])
+    if len(serial_rows):
+        serials = (
+            (truth.gather(serial_rows) - datetime(1899,12,30)).dt.total_milliseconds() / 86_400_000
+        ).round(9).cast(pl.Utf8)
+        mangled = mangled.scatter(serial_rows,serials)
+
+    return pl.DataFrame([mangled,truth])
+
+
+def write_mangled(df : pl.DataFrame
+                 ,path : str | Path
+                 ) -> None:
+    """
+    Write a frame from `generate_mangled` to CSV, Parquet or xlsx, depending
+    on the suffix of `path`. The truth column is written alongside the mangled
+    one.
+
+    Raises
+    ------
+    `ValueError`
+        If the suffix isn't one we can write, or the frame won't fit on an xlsx
+        sheet.
+    `ImportError`
+        If writing xlsx, and `xlsxwriter` isn't installed.
+    """
+
+    path = Path(path)
+
+    match path.suffix:
+        case ".csv":
+            df.write_csv(path)
+        case ".parquet":
+            df.write_parquet(path)
+        case ".xlsx":
+            if df.height > XLSX_MAX_ROWS:
+                raise ValueError(f"An xlsx sheet holds at most {XLSX_MAX_ROWS} rows, not {df.height}")
+            try:
+                import xlsxwriter  # noqa: F401
+            except ImportError:
+                raise ImportError("Writing xlsx files needs xlsxwriter: `pip install xlsxwriter`") from None
+            df.write_excel(path,autofit=False)
+        case _:
+            raise ValueError(f"Can only write .csv, .parquet or .xlsx files, not {path.suffix}")
@@ -0,0 +1,124 @@
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import fastexcel
+import polars as pl
+
+from .formats import stratified_sample
+from .parser import Parser
+
+"""
+Parsing every sheet of a workbook at once.
+
+Our workbooks often have dozens of sheets with the same mangled date layout.
+Rather than reading and parsing them one after another, we read the sheets
+concurrently through fastexcel, decide on the date format once from a sample
+drawn across all of them, and then parse them in parallel - polars releases the
+GIL while it works, so the parses really do run side by side.
+"""
+
+SHEET_COL = "sheet"
+
+
+def _read_sheet(path : str | Path
+               ,sheet_name : str
+               ) -> pl.DataFrame:
+    # Each read gets its own reader, since a fastexcel reader can't be shared
+    # between threads.
+    return fastexcel.read_excel(path).load_sheet_by_name(sheet_name).to_polars()
+
+
+def parse_workbook(path : str | Path
+                  ,date_column : str
+                  ,parser : Parser | None = None
+                  ,sheets : list[str] | None = None
+                  ,concat : bool = False
+                  ,sample_size : int = 1000
+                  ,max_workers : int | None = None
+                  ) -> dict[str,pl.DataFrame] | pl.DataFrame:
+    """
+    Read and parse the same date column from every sheet of a workbook.
+
+    Parameters
+    ----------
+    `path` : str | Path
+        The workbook to read.
+    `date_column` : str
+        The name of the date column, which must be present on every sheet.
+    `parser` : Parser, optional
+        The parser to use. Defaults to `Parser(mode="datetime")`.
+    `sheets` : list[str], optional
+        The sheets to parse. Defaults to every sheet in the workbook.
+    `concat` : bool, optional
+        If True, return one frame with a "sheet" column saying which sheet 
+        each row came from, rather than a dict of frames. Defaults to False.
+    `sample_size` : int, optional
+        The number of values, across all the sheets, used to decide on the date
+        format. Defaults to 1000.
+    `max_workers` : int, optional
+        The number of threads used to read and parse. Defaults to one per sheet,
+        up to the `ThreadPoolExecutor` default.
+
+    Returns
+    -------
+    `dict[str,pl.DataFrame] | pl.DataFrame`
+        The parsed sheets, keyed by sheet name, or concatenated if `concat`.
+
+    Raises
+    ------
+    `ValueError`
+        If a requested sheet doesn't exist, or doesn't have `date_column`.
+    """
+
+    if parser is None:
+        parser = Parser(mode="datetime")
+
+    sheet_names = fastexcel.read_excel(path).sheet_names
+    if sheets is None:
+        sheets = sheet_names
+    elif missing := set(sheets) - set(sheet_names):
+        raise ValueError(f"Sheets {sorted(missing)} not found in {path}")
+
+    if not sheets:
+        return pl.DataFrame() if concat else {}
+
+    # Every thread opens its own reader, so don't start more of them than the
+    # `ThreadPoolExecutor` default, however many sheets there are
+    if max_workers is None:
+        max_workers = min(len(sheets), 32, (os.cpu_count() or 1) + 4)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        frames = dict(zip(sheets,pool.map(lambda name: _read_sheet(path,name),sheets)))
+
+        for name, df in frames.items():
+            if date_column not in df.columns:
+                raise ValueError(f"Column {date_column} not found in sheet {name}")
+
+        # Decide on the format once, from an even sample across every sheet
+        sample = stratified_sample([df[date_column] for df in frames.values()],sample_size)
+        locked = parser.lock_format(sample)
+        locked._checkpoint("sample",sample.len(),sample.len())
+
+        def parse_sheet(name : str
+                       ,df : pl.DataFrame
+                       ) -> pl.DataFrame:
+            # A copy per sheet, since parsers record their last run, and so 
+            # that progress is reported against the sheet
+            sheet_parser = copy.copy(locked)
+            sheet_parser.piece = name
+            return sheet_parser(df,date_column)
+
+        parsed = dict(zip(frames,pool.map(parse_sheet,frames,frames.values())))
+
+    if not concat:
+        return parsed
+
+    return pl.concat(
+        [
+            df.with_columns(pl.lit(name).alias(SHEET_COL))
+            for name, df in parsed.items()
+        ]
+        ,how="diagonal_relaxed"
+    )
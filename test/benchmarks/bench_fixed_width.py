@@ -0,0 +1,55 @@
+import sys
+import time
+
+import polars as pl
+
+import excellaint as ea
+
+"""
+The fixed width engine against the split engine, on a fixed width column that
+the fast path won't take (`fast_path=False`), so that both go through the
+component pipeline. Run with:
+
+    python test/benchmarks/bench_fixed_width.py [n_rows]
+"""
+
+
+def make_frame(n_rows : int) -> pl.DataFrame:
+    stamps = (
+        pl.int_range(0,n_rows,eager=True).cast(pl.Int64) * 3_600_000_000
+        + 946_684_800_000_000
+    ).cast(pl.Datetime("us"))
+    return pl.DataFrame({"dates" : stamps.dt.strftime("%d/%m/%Y %H:%M")})
+
+
+def best_of(func, repeats : int = 3) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    df = make_frame(n_rows)
+
+    split = ea.Parser(mode="datetime",fast_path=False,engine="split")
+    fixed = ea.Parser(mode="datetime",fast_path=False,engine="fixed_width")
+
+    indexed = split._add_index(df)
+
+    def split_stage():
+        out = split._split_datetimes(indexed,datetime_col="dates")
+        out = split._convert_time(out)
+        return split._split_dates(out,datetime_col="dates")
+
+    def fixed_stage():
+        return fixed._extract_fixed_width(indexed,"dates")
+
+    print(f"{n_rows:,} rows")
+    print(f"  split stage       : {best_of(split_stage):7.3f} s")
+    print(f"  fixed width stage : {best_of(fixed_stage):7.3f} s")
+    print(f"  split end to end  : {best_of(lambda: split(df,'dates',check_sorted=False)):7.3f} s")
+    print(f"  fixed end to end  : {best_of(lambda: fixed(df,'dates',check_sorted=False)):7.3f} s")
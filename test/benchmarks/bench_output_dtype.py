@@ -0,0 +1,67 @@
+import resource
+import subprocess
+import sys
+import time
+
+import polars as pl
+
+import excellaint as ea
+
+"""
+Peak memory and output size of the component pipeline for each output dtype.
+
+Each configuration runs in its own subprocess so that the peak RSS we report
+belongs to that configuration alone. Run with:
+
+    python test/benchmarks/bench_output_dtype.py [n_rows]
+"""
+
+CONFIGS = {
+    "datetime[us]" : {"time_unit" : "us"},
+    "datetime[ms]" : {"time_unit" : "ms"},
+    "date" : {"output_dtype" : "date"},
+}
+
+
+def make_frame(n_rows : int) -> pl.DataFrame:
+    """
+    A mangled hourly column like `test/test_data/2_digit_yr.xlsx`: a mix of two
+    and four digit years, which forces the component pipeline rather than the 
+    fast path.
+    """
+    stamps = (
+        pl.int_range(0,n_rows,eager=True).cast(pl.Int64) * 3_600_000_000
+        + 946_684_800_000_000
+    ).cast(pl.Datetime("us"))
+
+    return pl.DataFrame({"stamps" : stamps}).select(
+        pl.when(pl.int_range(0,pl.len()) % 10 == 0)
+        .then(pl.col("stamps").dt.strftime("%d/%m/%y %H:%M"))
+        .otherwise(pl.col("stamps").dt.strftime("%d/%m/%Y %H:%M"))
+        .alias("dates")
+    )
+
+
+def run_one(name : str, n_rows : int) -> None:
+    df = make_frame(n_rows)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    eap = ea.Parser(mode="datetime",**CONFIGS[name])
+    start = time.perf_counter()
+    out = eap(df,"dates",check_sorted=False)
+    elapsed = time.perf_counter() - start
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{name:>14} | {elapsed:7.2f} s | peak +{(rss_after - rss_before) / 1024:8.1f} MiB"
+          f" | output {out.estimated_size('mb'):7.1f} MB")
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    if len(sys.argv) > 2:
+        run_one(sys.argv[2],n_rows)
+    else:
+        print(f"{n_rows:,} rows")
+        for name in CONFIGS:
+            subprocess.run([sys.executable,__file__,str(n_rows),name],check=True)
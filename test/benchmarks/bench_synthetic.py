@@ -0,0 +1,46 @@
+import sys
+import time
+from datetime import datetime, timedelta
+
+import polars as pl
+
+import excellaint as ea
+
+"""
+Throughput and accuracy of a lenient parse over a large synthetic column, with
+a realistic mix of Excel manglings. Accuracy is the share of rows that come back
+equal to the ground truth. Run with:
+
+    python test/benchmarks/bench_synthetic.py [n_rows]
+"""
+
+MANGLINGS = {
+    "mdy_swap" : 0.01,
+    "two_digit_year" : 0.05,
+    "midnight_as_noon" : 0.2,
+    "dropped_time" : 0.2,
+    "serial" : 0.01,
+    "separator_noise" : 0.01,
+}
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    start = time.perf_counter()
+    df = ea.generate_mangled(n_rows,start=datetime(2000,1,1),frequency=timedelta(minutes=1),**MANGLINGS)
+    generated = time.perf_counter() - start
+
+    parser = ea.Parser(mode="datetime",lenient=True)
+
+    start = time.perf_counter()
+    parsed = parser(df,"mangled_dates",check_sorted=False)
+    elapsed = time.perf_counter() - start
+
+    correct = parsed.select((pl.col("Datetime") == pl.col("truth")).fill_null(False).mean()).item()
+
+    print(f"{n_rows:,} rows")
+    print(f"  generate : {generated:7.3f} s")
+    print(f"  parse    : {elapsed:7.3f} s ({n_rows / elapsed:,.0f} rows/s)")
+    print(f"  correct  : {correct:7.2%}")
+    print(ea.error_summary(parsed))
@@ -0,0 +1,59 @@
+import polars as pl
+
+import excellaint as ea
+from excellaint.cache import ComponentCache, column_fingerprint
+
+
+def test_cache_evicts_least_recently_used():
+    """
+    Check that the cache stays inside its byte budget, and throws out the 
+    entry that was used longest ago.
+    """
+
+    frames = {key : pl.DataFrame({"a" : list(range(100))}) for key in "abc"}
+    size = frames["a"].estimated_size()
+
+    cache = ComponentCache(max_bytes=2 * size)
+    cache.put("a",frames["a"])
+    cache.put("b",frames["b"])
+    cache.get("a")
+    cache.put("c",frames["c"])
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.nbytes == 2 * size
+
+    cache.put("huge",pl.DataFrame({"a" : list(range(1000))}))
+    assert "huge" not in cache
+
+
+def test_fingerprint_depends_on_order():
+    """
+    The same values in a different order are a different column.
+    """
+
+    series = pl.Series(["01/02/2020","02/02/2020"])
+
+    assert column_fingerprint(series) == column_fingerprint(series.clone())
+    assert column_fingerprint(series) != column_fingerprint(series.reverse())
+
+
+def test_parser_reuses_components():
+    """
+    Check that a differently configured parser picks the split components up 
+    from the cache, and gets the same answer it would have without it.
+    """
+
+    df = pl.DataFrame({"dates" : ["01/01/20 12:00","02/01/2020 13:00","03/01/2020 14:00"]})
+
+    cache = ComponentCache()
+    first = ea.Parser(mode="datetime",cache=cache)
+    second = ea.Parser(mode="datetime",cache=cache,allow_yearfirst=False)
+
+    first(df,"dates")
+    assert not first.last_run["cached"]
+
+    parsed = second(df,"dates")
+    assert second.last_run["cached"]
+    assert cache.hits == 1 and len(cache) == 1
+
+    assert parsed.equals(ea.Parser(mode="datetime")(df,"dates"))
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+import polars as pl
+import pytest
+from pytest import fixture
+
+import excellaint as ea
+
+
+@fixture
+def hourly():
+    """
+    An hourly series with a two hour gap and a duplicated timestamp in it.
+    """
+
+    stamps = [datetime(2020,1,1,hr) for hr in range(6)]
+    stamps = stamps[:3] + stamps[5:] + [stamps[-1]] + [datetime(2020,1,1,6)]
+
+    return pl.DataFrame({"Datetime" : stamps})
+
+
+def test_cadence_frequency_and_irregularities(hourly):
+    """
+    Check that we pick up the hourly frequency, the gap, and the duplicate.
+    """
+
+    cadence = ea.detect_cadence(hourly)
+
+    assert cadence.frequency == timedelta(hours=1)
+    assert cadence.gaps["row"].to_list() == [3]
+    assert cadence.gaps["missing"].to_list() == [2]
+    assert cadence.duplicates["row"].to_list() == [4]
+    assert cadence.longest_run_start == 0
+    assert cadence.longest_run_length == 3
+    assert not cadence.is_regular
+
+
+def test_cadence_from_parser():
+    """
+    Check that the parser can hand back the cadence as a by-product of the parse.
+    """
+
+    df = pl.DataFrame(
+        {"dates" : [f"2020/01/01 {hr:02d}:00" for hr in range(24)]}
+    )
+
+    eap = ea.Parser(mode="datetime")
+    parsed, cadence = eap(df,"dates",return_cadence=True)
+
+    assert "Datetime" in parsed.columns
+    assert cadence.frequency == timedelta(hours=1)
+    assert cadence.is_regular
+    assert cadence.longest_run_length == 24
+
+
+def test_cadence_with_nulls():
+    """
+    A row that failed to parse should be reported, and shouldn't hide the gap
+    it leaves in the series.
+    """
+
+    df = pl.DataFrame(
+        {"dates" : ["01/01/2020 00:00","bad","01/01/2020 02:00","01/01/2020 03:00","01/01/2020 04:00"]}
+    )
+
+    with pytest.warns(UserWarning,match="1 rows"):
+        _, cadence = ea.Parser(mode="datetime",lenient=True)(df,"dates",check_sorted=False,return_cadence=True)
+
+    assert cadence.frequency == timedelta(hours=1)
+    assert not cadence.is_regular
+    assert cadence.irregularities["kind"].to_list() == ["null","gap"]
+    assert cadence.irregularities["row"].to_list() == [1,2]
+    assert cadence.gaps["missing"].to_list() == [1]
+    assert cadence.longest_run_start == 2
+    assert cadence.longest_run_length == 3
+
+    df = pl.DataFrame({"Datetime" : [datetime(2020,1,1,0),None,datetime(2020,1,1,3),datetime(2020,1,1,4)]})
+    cadence = ea.detect_cadence(df)
+
+    assert cadence.irregularities["kind"].to_list() == ["null","gap"]
+    assert cadence.gaps["missing"].to_list() == [2]
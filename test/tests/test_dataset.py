@@ -0,0 +1,90 @@
+import os
+from datetime import datetime
+
+import polars as pl
+import pytest
+from pytest import fixture
+
+import excellaint as ea
+
+
+@fixture
+def dataset(tmp_path):
+    """
+    A hive partitioned tree with one file per month. January only has days
+    <= 12, so on its own it's ambiguous between day first and month first.
+    """
+
+    src_dir = tmp_path / "raw"
+    stamps = pl.datetime_range(datetime(2020,1,1),datetime(2020,3,31),"1d",eager=True)
+    stamps = stamps.filter((stamps.dt.month() != 1) | (stamps.dt.day() <= 12))
+
+    for month in (1, 2, 3):
+        month_stamps = stamps.filter(stamps.dt.month() == month)
+        df = pl.DataFrame(
+            {
+                "dates" : month_stamps.dt.strftime("%d/%m/%Y"),
+                "value" : range(len(month_stamps)),
+            }
+        )
+
+        path = src_dir / "year=2020" / f"month={month:02d}"
+        path.mkdir(parents=True)
+        if month == 3:
+            df.write_csv(path / "part-0.csv")
+        else:
+            df.write_parquet(path / "part-0.parquet")
+
+    return stamps, src_dir, tmp_path / "parsed"
+
+
+def test_parse_dataset(dataset):
+    """
+    Check that every partition is parsed with the format decided across the
+    whole dataset, and that up to date partitions are skipped on a re-run.
+    """
+
+    stamps, src_dir, dst_dir = dataset
+
+    summary = ea.parse_dataset(src_dir,dst_dir,"dates",parser=ea.Parser(mode="date"))
+    assert summary["status"].to_list() == ["parsed"] * 3
+
+    parsed = pl.concat(
+        [
+            pl.read_parquet(dst_dir / "year=2020" / "month=01" / "part-0.parquet",hive_partitioning=False),
+            pl.read_parquet(dst_dir / "year=2020" / "month=02" / "part-0.parquet",hive_partitioning=False),
+            pl.read_csv(dst_dir / "year=2020" / "month=03" / "part-0.csv",try_parse_dates=True),
+        ]
+    )
+    assert parsed["Date"].equals(stamps.dt.date().alias("Date"))
+    assert not list(dst_dir.rglob("*.tmp"))
+
+    summary = ea.parse_dataset(src_dir,dst_dir,"dates",parser=ea.Parser(mode="date"))
+    assert summary["status"].to_list() == ["skipped"] * 3
+
+    src = src_dir / "year=2020" / "month=02" / "part-0.parquet"
+    os.utime(src,(src.stat().st_atime,src.stat().st_mtime + 10))
+    summary = ea.parse_dataset(src_dir,dst_dir,"dates",parser=ea.Parser(mode="date"))
+    assert summary["status"].to_list() == ["skipped","parsed","skipped"]
+
+
+def test_parse_dataset_missing_column(dataset):
+    _, src_dir, dst_dir = dataset
+
+    with pytest.raises(ValueError):
+        ea.parse_dataset(src_dir,dst_dir,"nope")
+
+
+def test_parse_dataset_sample_size(dataset):
+    """
+    Only about `sample_size` values should be drawn to decide on the format,
+    however big the files are.
+    """
+
+    _, src_dir, dst_dir = dataset
+
+    stages = []
+    parser = ea.Parser(mode="date",progress=lambda *args: stages.append(args))
+    ea.parse_dataset(src_dir,dst_dir,"dates",parser=parser,sample_size=6)
+
+    assert ("sample",None,6,6) in stages
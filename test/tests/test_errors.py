@@ -0,0 +1,91 @@
+import polars as pl
+import pytest
+from pytest import fixture
+
+import excellaint as ea
+
+
+@fixture
+def dirty_df():
+    """
+    A small datetime column with one of each kind of error we know how to flag.
+    """
+
+    dates = [
+        "01/01/2020 01:00",
+        "01-01/2020 02:00",
+        None,
+        "01/13/2020 03:00",
+        "31/02/2020 04:00",
+        "0a/01/2020 05:00",
+        "01/01/2020 25:00",
+        "02/01/2020 06:00",
+    ]
+
+    return pl.DataFrame({"dates" : dates, "row_id" : range(len(dates))})
+
+
+def test_strict_mode_raises(dirty_df):
+    """
+    Without lenient mode, a single bad cell should still sink the whole column.
+    """
+
+    eap = ea.Parser(mode="datetime")
+
+    with pytest.raises(pl.exceptions.ComputeError):
+        eap(dirty_df,"dates",check_sorted=False)
+
+
+def test_lenient_error_codes(dirty_df):
+    """
+    Check that lenient mode nulls out the bad rows, keeps the good ones, and 
+    tells us what was wrong with each.
+    """
+
+    eap = ea.Parser(mode="datetime",lenient=True)
+
+    with pytest.warns(UserWarning,match="6 rows"):
+        df = eap(dirty_df,"dates",check_sorted=False)
+
+    assert df["row_id"].to_list() == list(range(8))
+    assert df["Datetime"].null_count() == 6
+    assert df["excellaint_error"].to_list() == [
+        ea.ParseError.OK,
+        ea.ParseError.BAD_SEPARATOR,
+        ea.ParseError.MISSING,
+        ea.ParseError.MONTH_OUT_OF_RANGE,
+        ea.ParseError.INVALID_DAY,
+        ea.ParseError.BAD_COMPONENT,
+        ea.ParseError.BAD_TIME,
+        ea.ParseError.OK,
+    ]
+
+    summary = ea.error_summary(df)
+    assert summary["count"].sum() == 6
+    assert summary.filter(pl.col("error") == "INVALID_DAY")["first_row"].item() == 4
+
+
+def test_lenient_with_date_format():
+    """
+    A format we've been given is still trusted in lenient mode, but rows that
+    don't fit it are flagged rather than sinking the whole column.
+    """
+
+    df = pl.DataFrame({"dates" : ["01/01/2020 01:00", "01/01/2020 02:00:30", None, "01/01/2020 03:00"]})
+
+    with pytest.raises(pl.exceptions.ComputeError):
+        ea.Parser(mode="datetime",date_format="%d/%m/%Y %H:%M")(df,"dates",check_sorted=False)
+
+    eap = ea.Parser(mode="datetime",lenient=True,date_format="%d/%m/%Y %H:%M")
+
+    with pytest.warns(UserWarning,match="2 rows"):
+        parsed = eap(df,"dates",check_sorted=False)
+
+    assert eap.last_run["path"] == "fast"
+    assert parsed["Datetime"].null_count() == 2
+    assert parsed["excellaint_error"].to_list() == [
+        ea.ParseError.OK,
+        ea.ParseError.BAD_COMPONENT,
+        ea.ParseError.MISSING,
+        ea.ParseError.OK,
+    ]
@@ -0,0 +1,62 @@
+from datetime import datetime
+
+import polars as pl
+from pytest import fixture
+
+import excellaint as ea
+from excellaint.formats import candidate_formats, infer_strict_format
+
+
+@fixture
+def hourly_strings():
+    """
+    A clean hourly datetime column, written out in a year first format.
+    """
+
+    stamps = pl.datetime_range(datetime(2020,1,1),datetime(2020,3,1),"1h",eager=True)
+
+    return stamps, stamps.dt.strftime("%Y/%m/%d %H:%M")
+
+
+def test_infer_strict_format(hourly_strings):
+    """
+    Check that we can pick out a single strict format from the candidates.
+    """
+
+    _, strings = hourly_strings
+    candidates = candidate_formats("datetime","/",":"," ")
+
+    assert infer_strict_format(strings,candidates) == "%Y/%m/%d %H:%M"
+    assert infer_strict_format(pl.Series(["01/01/20 01:00"]),candidates) is None
+
+
+def test_infer_ambiguous_format():
+    """
+    If we can't tell day first from month first, we shouldn't guess.
+    """
+
+    strings = pl.Series(["01/02/2020","03/04/2020","05/06/2020"])
+    candidates = candidate_formats("date","/",":"," ",allow_monthfirst=True)
+
+    assert infer_strict_format(strings,candidates,mode="date") is None
+
+
+def test_fast_path_matches_generic(hourly_strings):
+    """
+    The fast path and the component pipeline should give the same answer, and
+    the parser should tell us which one it took.
+    """
+
+    stamps, strings = hourly_strings
+    df = pl.DataFrame({"dates" : strings, "row_id" : range(len(strings))})
+
+    fast = ea.Parser(mode="datetime")
+    generic = ea.Parser(mode="datetime",fast_path=False)
+
+    fast_df = fast(df,"dates")
+    generic_df = generic(df,"dates")
+
+    assert fast.last_run == {"path" : "fast", "format" : "%Y/%m/%d %H:%M"}
+    assert generic.last_run["path"] == "generic"
+    assert fast_df.equals(generic_df)
+    assert fast_df["Datetime"].equals(stamps.alias("Datetime"))
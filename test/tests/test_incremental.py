@@ -0,0 +1,110 @@
+from datetime import datetime
+
+import polars as pl
+import pytest
+from pytest import fixture
+
+import excellaint as ea
+
+
+@fixture
+def feed():
+    """
+    An hourly feed, as strings, that we can grow a bit at a time.
+    """
+
+    stamps = pl.datetime_range(datetime(2020,1,1),datetime(2020,1,10),"1h",eager=True)
+
+    return stamps, pl.DataFrame(
+        {
+            "dates" : stamps.dt.strftime("%d/%m/%Y %H:%M"),
+            "row_id" : range(len(stamps)),
+        }
+    )
+
+
+def test_incremental_append(feed, tmp_path):
+    """
+    Check that the first run parses everything, later runs only parse what has 
+    been appended, and the watermark survives a new process.
+    """
+
+    stamps, df = feed
+    state_path = tmp_path / "state.json"
+
+    inc = ea.IncrementalParser(ea.Parser(mode="datetime"),state_path=state_path)
+
+    first = inc(df.head(100),"dates",source="feed")
+    assert inc.last_mode == "full"
+    assert first.height == 100
+
+    inc = ea.IncrementalParser(ea.Parser(mode="datetime"),state_path=state_path)
+    second = inc(df.head(150),"dates",source="feed")
+
+    assert inc.last_mode == "append"
+    assert second["row_id"].to_list() == list(range(100,150))
+    assert second["Datetime"].equals(stamps.slice(100,50).alias("Datetime"))
+    assert inc.watermarks["feed"].format == "%d/%m/%Y %H:%M"
+    assert inc.watermarks["feed"].n_rows == 150
+
+    assert inc(df.head(150),"dates",source="feed").height == 0
+
+
+def test_incremental_head_changed(feed):
+    """
+    If rows we've already parsed change, we should re-parse the lot.
+    """
+
+    _, df = feed
+
+    inc = ea.IncrementalParser(ea.Parser(mode="datetime"))
+    inc(df.head(100),"dates",source="feed")
+
+    edited = df.head(120).with_columns(
+        pl.when(pl.col("row_id") == 99).then(pl.lit("01/01/2021 00:00")).otherwise(pl.col("dates")).alias("dates")
+    )
+
+    with pytest.warns(UserWarning,match="have changed"):
+        parsed = inc(edited,"dates",source="feed")
+
+    assert inc.last_mode == "full"
+    assert parsed.height == 120
+
+
+def test_incremental_format_changed(feed):
+    """
+    Appended rows that no longer fit the locked in format should be re-parsed
+    with the component pipeline, and not nulled out in lenient mode.
+    """
+
+    stamps, df = feed
+
+    inc = ea.IncrementalParser(ea.Parser(mode="datetime",lenient=True))
+    inc(df.head(100),"dates",source="feed")
+
+    appended = df.slice(100,2).with_columns(pl.col("dates") + ":00")
+
+    with pytest.warns(UserWarning,match="no longer in the format"):
+        parsed = inc(pl.concat([df.head(100),appended]),"dates",source="feed")
+
+    assert inc.last_mode == "append"
+    assert parsed["Datetime"].equals(stamps.slice(100,2).alias("Datetime"))
+    assert parsed["excellaint_error"].to_list() == [ea.ParseError.OK] * 2
+
+
+def test_incremental_lenient_empty_append(feed):
+    """
+    A lenient run with nothing appended should still have the error column, so
+    that successive runs can be concatenated.
+    """
+
+    _, df = feed
+
+    inc = ea.IncrementalParser(ea.Parser(mode="datetime",lenient=True))
+    full = inc(df.head(100),"dates",source="feed")
+    append = inc(df.head(120),"dates",source="feed")
+    empty = inc(df.head(120),"dates",source="feed")
+
+    assert empty.height == 0
+    assert empty.schema == full.schema
+    assert pl.concat([full,append,empty]).height == 120
@@ -0,0 +1,61 @@
+from datetime import datetime
+
+import numpy as np
+import polars as pl
+import pytest
+
+import excellaint as ea
+
+
+def test_sorted_flag():
+    """
+    Check that a sorted output is flagged as such, and an unsorted one isn't.
+    """
+
+    stamps = pl.datetime_range(datetime(2020,1,1),datetime(2020,1,2),"1h",eager=True)
+    df = pl.DataFrame({"dates" : stamps.dt.strftime("%d/%m/%Y %H:%M")})
+
+    parser = ea.Parser(mode="datetime")
+    parsed = parser(df,"dates")
+    assert parsed["Datetime"].flags["SORTED_ASC"]
+
+    parsed = parser(df.reverse(),"dates",check_sorted=False)
+    assert not parsed["Datetime"].flags["SORTED_ASC"]
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 4096])
+def test_time_index(block_size):
+    """
+    Check that range lookups match a plain filter, for sorted and unsorted 
+    columns with nulls in them.
+    """
+
+    stamps = pl.datetime_range(datetime(2020,1,1),datetime(2020,1,10),"1h",eager=True)
+    sorted_df = pl.DataFrame({"Datetime" : pl.concat([pl.Series([None,None],dtype=stamps.dtype),stamps])})
+    unsorted_df = sorted_df.sample(fraction=1.0,shuffle=True,seed=0)
+
+    bounds = [
+        (datetime(2020,1,3),datetime(2020,1,4,12)),
+        (None,datetime(2020,1,2)),
+        (datetime(2020,1,9,5),None),
+        (datetime(2019,1,1),datetime(2019,6,1)),
+        (datetime(2020,1,5),datetime(2020,1,5)),
+    ]
+
+    for df in (sorted_df, unsorted_df):
+        index = ea.TimeIndex(df["Datetime"],block_size=block_size)
+        assert index.is_sorted == (df is sorted_df)
+
+        for start, end in bounds:
+            expected = df.with_row_index("row").filter(
+                (pl.col("Datetime") >= (start or datetime.min))
+                & (pl.col("Datetime") < (end or datetime.max))
+            )
+            assert np.array_equal(index.rows(start,end),expected["row"].to_numpy())
+            assert index.filter(df,start,end).equals(expected.drop("row"))
+
+    with pytest.raises(ValueError):
+        ea.TimeIndex(unsorted_df["Datetime"]).range(datetime(2020,1,3))
+
+    with pytest.raises(TypeError):
+        ea.TimeIndex(pl.Series([1,2,3]))
@@ -0,0 +1,44 @@
+import polars as pl
+import pytest
+
+import excellaint as ea
+
+
+@pytest.fixture
+def ipc_file(tmp_path):
+    df = ea.generate_mangled(1000).with_columns(
+        pl.int_range(0,pl.len()).alias("row_id"),
+        pl.col("mangled_dates").alias("note"),
+    )
+    path = tmp_path / "in.arrow"
+    df.write_ipc(path)
+
+    return df, path
+
+
+def test_parse_ipc(ipc_file, tmp_path):
+    """
+    Check that parsing from one IPC file to another gives the same frame as 
+    parsing in memory, and that a parser accepts an IPC path directly.
+    """
+
+    df, path = ipc_file
+    parser = ea.Parser(mode="datetime")
+    expected = parser(df,"mangled_dates")
+
+    destination = tmp_path / "out.arrow"
+    parser.parse_ipc(path,destination,"mangled_dates")
+
+    written = pl.read_ipc(destination,memory_map=True)
+    assert written.equals(expected)
+    assert written["Datetime"].equals(df["truth"].alias("Datetime"))
+    assert not list(tmp_path.glob("*.tmp"))
+
+    assert parser(path,"mangled_dates").equals(expected)
+
+    # Writing over the source is fine too
+    parser.parse_ipc(path,path,"mangled_dates")
+    assert pl.read_ipc(path).equals(expected)
+
+    with pytest.raises(ValueError):
+        parser.parse_ipc(destination,tmp_path / "nope.arrow","mangled_dates")
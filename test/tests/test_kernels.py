@@ -0,0 +1,57 @@
+import numpy as np
+import polars as pl
+import pyarrow as pa
+
+import excellaint as ea
+from excellaint.kernels import extract_fixed_width, string_buffers
+
+
+def test_string_buffers_zero_copy():
+    """
+    Check that the data buffer we get back from an Arrow array is a view of the 
+    array's own memory.
+    """
+
+    arr = pa.array(["01/01/2020","02/01/2020",None,"04/01/2020"],type=pa.large_string())
+
+    offsets, data, valid = string_buffers(arr)
+
+    assert data.ctypes.data == arr.buffers()[2].address
+    assert list(np.diff(offsets)) == [10,10,0,10]
+    assert list(valid) == [True,True,False,True]
+
+
+def test_extract_fixed_width():
+    """
+    Check that we pull the right numbers out of each component, and refuse 
+    columns which aren't fixed width.
+    """
+
+    series = pl.Series(["01/02/2020 13:45","31/12/1999 00:05"])
+
+    components, widths = extract_fixed_width(series,["/"," ",":"])
+
+    assert widths == [2,2,4,2,2]
+    assert [list(comp) for comp in components] == [[1,31],[2,12],[2020,1999],[13,0],[45,5]]
+
+    assert extract_fixed_width(pl.Series(["1/02/2020","31/12/1999"]),["/"]) is None
+    assert extract_fixed_width(pl.Series(["01/02/2020","31-12-1999"]),["/","-"]) is None
+
+
+def test_fixed_width_engine_matches_split():
+    """
+    The two engines should agree, and the fixed width engine should fall back 
+    on splitting when the column isn't fixed width.
+    """
+
+    df = pl.DataFrame({"dates" : ["01/01/2020 00:00","01/01/2020 01:00",None,"02/01/2020 13:30"]})
+
+    split = ea.Parser(mode="datetime",fast_path=False)
+    fixed = ea.Parser(mode="datetime",fast_path=False,engine="fixed_width")
+
+    assert fixed(df,"dates",check_sorted=False).equals(split(df,"dates",check_sorted=False))
+    assert fixed.last_run["engine"] == "fixed_width"
+
+    mixed = pl.DataFrame({"dates" : ["01/01/20 00:00","01/01/2020 01:00"]})
+    assert fixed(mixed,"dates").equals(split(mixed,"dates"))
+    assert fixed.last_run["engine"] == "split"
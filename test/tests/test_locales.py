@@ -0,0 +1,84 @@
+import polars as pl
+import pytest
+
+import excellaint as ea
+from excellaint.locales import month_lookup, weekday_lookup
+
+
+def test_lookups():
+    assert month_lookup(["en"])["sept"] == 9
+    assert month_lookup(["en","fr"])["févr"] == 2
+    assert weekday_lookup(["de"])["so"] == 7
+
+    with pytest.raises(ValueError):
+        month_lookup(["xx"])
+
+    with pytest.raises(ValueError):
+        ea.Parser(locale="xx")
+
+
+@pytest.mark.parametrize("fast_path", [True, False])
+def test_month_names(fast_path):
+    """
+    Check that month names come out as the right month on either path, 
+    including with two digit years where only the month name tells us which
+    component is which.
+    """
+
+    df = pl.DataFrame({"dates" : ["01-Jan-20","15-Feb-20","31-Dec-21"]})
+    parsed = ea.Parser(date_sep="-",locale="en",fast_path=fast_path)(df,"dates",check_sorted=False)
+    assert parsed["Date"].cast(pl.Utf8).to_list() == ["2020-01-01","2020-02-15","2021-12-31"]
+
+    df = pl.DataFrame({"dates" : ["03 janv. 2020","15 févr. 2020","1 août 2020"]})
+    parsed = ea.Parser(date_sep=" ",locale=["en","fr"],fast_path=fast_path)(df,"dates",check_sorted=False)
+    assert parsed["Date"].cast(pl.Utf8).to_list() == ["2020-01-03","2020-02-15","2020-08-01"]
+
+    df = pl.DataFrame({"dates" : ["Jan 03 2020","Feb 04 2020","Mar 05 2020"]})
+    eap = ea.Parser(date_sep=" ",locale="en",fast_path=fast_path)
+    parsed = eap(df,"dates",check_sorted=False)
+    assert parsed["Date"].cast(pl.Utf8).to_list() == ["2020-01-03","2020-02-04","2020-03-05"]
+    if fast_path:
+        assert eap.last_run == {"path" : "fast", "format" : "%m %d %Y"}
+
+    df = pl.DataFrame({"dates" : ["01-Foo-20"]})
+    with pytest.raises(pl.exceptions.ComputeError):
+        ea.Parser(date_sep="-",locale="en",fast_path=fast_path)(df,"dates",check_sorted=False)
+
+
+def test_weekdays():
+    """
+    Check that a leading weekday is stripped, and that a weekday which 
+    doesn't match its date raises a warning, or an error code when lenient.
+    """
+
+    df = pl.DataFrame({"dates" : ["Mon 03/02/2020","Tuesday, 04/02/2020","Mon 05/02/2020",None]})
+
+    with pytest.warns(UserWarning,match="1 rows"):
+        parsed = ea.Parser(locale="en")(df,"dates",check_sorted=False)
+    assert parsed["Date"].cast(pl.Utf8).to_list() == ["2020-02-03","2020-02-04","2020-02-05",None]
+
+    parsed = ea.Parser(locale="en",lenient=True)(df,"dates",check_sorted=False)
+    assert parsed["Date"].cast(pl.Utf8).to_list() == ["2020-02-03","2020-02-04",None,None]
+    assert parsed["excellaint_error"].to_list() == [
+        ea.ParseError.OK,
+        ea.ParseError.OK,
+        ea.ParseError.WEEKDAY_MISMATCH,
+        ea.ParseError.MISSING,
+    ]
+
+
+@pytest.mark.parametrize("fast_path", [True, False])
+def test_month_or_weekday(fast_path):
+    """
+    "mar" is both March in English and Tuesday (mardi) in French. It should be
+    read as a month unless a whole date follows it.
+    """
+
+    df = pl.DataFrame({"dates" : ["Mar 03 2020","Mar 10 2020","Apr 07 2020"]})
+    parsed = ea.Parser(date_sep=" ",locale=["en","fr"],fast_path=fast_path)(df,"dates",check_sorted=False)
+    assert parsed["Date"].cast(pl.Utf8).to_list() == ["2020-03-03","2020-03-10","2020-04-07"]
+
+    df = pl.DataFrame({"dates" : ["mar. 03/03/2020","mar. 10/03/2020"]})
+    parsed = ea.Parser(locale=["en","fr"],fast_path=fast_path,lenient=True)(df,"dates",check_sorted=False)
+    assert parsed["Date"].cast(pl.Utf8).to_list() == ["2020-03-03","2020-03-10"]
+    assert parsed["excellaint_error"].to_list() == [ea.ParseError.OK] * 2
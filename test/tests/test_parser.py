@@ -75,3 +75,56 @@ def test_autoindex_col():
     assert set(df.columns) == set(["date","runtime_id"])
 
 
+
+def test_output_dtype_and_time_unit():
+    """
+    Check that we can ask for a date, or a datetime in a coarser unit, from the
+    component pipeline and the fast path alike.
+    """
+
+    mangled = pl.DataFrame({"dates" : ["01/01/20 12:00","31/01/2020 13:30","29/02/2020 23:59"]})
+    clean = pl.DataFrame({"dates" : ["01/01/2020 12:00","31/01/2020 13:30","29/02/2020 23:59"]})
+
+    for df in [mangled, clean]:
+        ms_df = ea.Parser(mode="datetime",time_unit="ms")(df,"dates")
+        assert ms_df.schema["Datetime"] == pl.Datetime("ms")
+        assert ms_df["Datetime"].dt.minute().to_list() == [0,30,59]
+
+        date_df = ea.Parser(mode="datetime",output_dtype="date")(df,"dates")
+        assert date_df.schema["Date"] == pl.Date
+        assert date_df["Date"].dt.day().to_list() == [1,31,29]
+
+    with pytest.raises(ValueError):
+        ea.Parser(time_unit="s")
+
+
+@pytest.mark.parametrize("snap", ["second", "minute", "cadence"])
+def test_snap(snap):
+    """
+    Check that times with seconds and fractional seconds parse, and that 
+    snapping rounds away the drift and reports what it moved.
+    """
+
+    df = pl.DataFrame(
+        {
+            "dates" : [
+                "01/01/2020 10:59:59.999",
+                "01/01/2020 12:00",
+                "01/01/2020 13:00:00.0004",
+                "01/01/2020 14:00:00",
+            ]
+        }
+    )
+
+    parser = ea.Parser(mode="datetime",time_unit="ns")
+    assert parser(df,"dates")["Datetime"].dt.nanosecond().to_list() == [999_000_000, 0, 400_000, 0]
+
+    parser = ea.Parser(mode="datetime",snap=snap)
+    parsed = parser(df,"dates")
+    assert parsed["Datetime"].dt.hour().to_list() == [11, 12, 13, 14]
+    assert parsed["Datetime"].dt.microsecond().to_list() == [0, 0, 0, 0]
+    assert parser.last_run["snap"]["rows_moved"] == 2
+    assert parser.last_run["snap"]["max_shift"].microseconds == 1000
+
+    with pytest.raises(ValueError):
+        ea.Parser(snap="hour")
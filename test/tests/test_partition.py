@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import polars as pl
+import pytest
+
+import excellaint as ea
+from excellaint.partition import diff, is_sorted, partition_bounds
+
+
+def test_partition_bounds():
+    assert partition_bounds(10,3) == [(0,4),(4,3),(7,3)]
+    assert partition_bounds(2,4) == [(0,1),(1,1)]
+    assert partition_bounds(0,4) == [(0,0)]
+
+    with pytest.raises(ValueError):
+        partition_bounds(10,0)
+
+
+@pytest.mark.parametrize("n_partitions", [1, 2, 3, 7, 50])
+def test_partitioned_stages_match(n_partitions):
+    """
+    Check that the partitioned sort check and diff give exactly the single
+    partition result, including when the offending rows sit on a partition 
+    boundary.
+    """
+
+    stamps = pl.datetime_range(datetime(2020,1,1),datetime(2020,1,3),"1h",eager=True)
+    assert is_sorted(stamps,n_partitions)
+    assert diff(stamps,n_partitions).equals(stamps.diff())
+
+    for row in range(1,stamps.len()):
+        swapped = stamps.scatter([row - 1, row],[stamps[row], stamps[row - 1]])
+        assert not is_sorted(swapped,n_partitions)
+        assert diff(swapped,n_partitions).equals(swapped.diff())
+
+    with_nulls = pl.Series(["a",None,"b"])
+    assert is_sorted(with_nulls,n_partitions) == with_nulls.is_sorted()
+
+
+def test_parser_partitions():
+    stamps = pl.datetime_range(datetime(2020,1,1),datetime(2020,1,10),"1h",eager=True)
+    stamps = stamps.filter(stamps.dt.day() != 5)
+    df = pl.DataFrame({"dates" : stamps.dt.strftime("%d/%m/%Y %H:%M")})
+
+    single, single_cadence = ea.Parser(mode="datetime")(df,"dates",return_cadence=True)
+    multi, multi_cadence = ea.Parser(mode="datetime",n_partitions=4)(df,"dates",return_cadence=True)
+
+    assert multi.equals(single)
+    assert multi_cadence.frequency == single_cadence.frequency
+    assert multi_cadence.longest_run_start == single_cadence.longest_run_start
+    assert multi_cadence.irregularities.equals(single_cadence.irregularities)
+
+    with pytest.raises(ValueError):
+        ea.Parser(n_partitions=0)
@@ -0,0 +1,83 @@
+from datetime import datetime
+
+import polars as pl
+import pytest
+
+import excellaint as ea
+
+
+def test_progress_stages():
+    df = ea.generate_mangled(1000,start=datetime(2001,1,1),two_digit_year=0.2)
+
+    stages = []
+    parser = ea.Parser(mode="datetime",progress=lambda *args: stages.append(args))
+    parser(df,"mangled_dates",return_cadence=True)
+
+    assert [stage for stage, *_ in stages] == ["start","sort_check","tokenise","parse","join","cadence","done"]
+    assert all(piece is None and rows_total == 1000 for _, piece, _, rows_total in stages)
+    assert [rows_done for _, _, rows_done, _ in stages] == [0] * 6 + [1000]
+
+
+def test_cancel():
+    df = ea.generate_mangled(1000)
+
+    token = ea.CancellationToken()
+    parser = ea.Parser(mode="datetime",cancel=token)
+    parser(df,"mangled_dates")
+
+    token.cancel()
+    with pytest.raises(ea.ParseCancelled):
+        parser(df,"mangled_dates")
+
+
+def test_cancel_dataset(tmp_path):
+    """
+    Check that cancelling part way through a dataset stops it, without 
+    leaving any partial output behind. The file that was already being 
+    written when we cancelled is finished off.
+    """
+
+    src_dir = tmp_path / "raw"
+    for part in range(4):
+        (src_dir / f"part={part}").mkdir(parents=True)
+        ea.generate_mangled(1000,seed=part).write_parquet(src_dir / f"part={part}" / "data.parquet")
+
+    token = ea.CancellationToken()
+
+    def cancel_after_first_write(stage : str, piece : str | None, rows_done : int, rows_total : int) -> None:
+        if stage == "write":
+            token.cancel()
+
+    parser = ea.Parser(mode="datetime",progress=cancel_after_first_write,cancel=token)
+    with pytest.raises(ea.ParseCancelled):
+        ea.parse_dataset(src_dir,tmp_path / "parsed","mangled_dates",parser=parser,max_workers=1)
+
+    written = list((tmp_path / "parsed").rglob("*"))
+    assert not [path for path in written if path.suffix == ".tmp"]
+    finished = [path for path in written if path.suffix == ".parquet"]
+    assert len(finished) == 1
+    assert pl.read_parquet(finished[0],hive_partitioning=False).height == 1000
+
+
+def test_progress_pieces(tmp_path):
+    """
+    Check that each file of a dataset reports progress against itself, so 
+    that the rows done can be added up across files.
+    """
+
+    src_dir = tmp_path / "raw"
+    for part in range(3):
+        (src_dir / f"part={part}").mkdir(parents=True)
+        ea.generate_mangled(100 * (part + 1),seed=part).write_parquet(src_dir / f"part={part}" / "data.parquet")
+
+    rows_done = {}
+
+    def track(stage : str, piece : str | None, done : int, total : int) -> None:
+        if piece is not None:
+            rows_done[piece] = done
+
+    parser = ea.Parser(mode="datetime",progress=track)
+    ea.parse_dataset(src_dir,tmp_path / "parsed","mangled_dates",parser=parser)
+
+    assert sorted(rows_done) == sorted(str(path) for path in src_dir.rglob("*.parquet"))
+    assert sum(rows_done.values()) == 600
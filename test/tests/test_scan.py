@@ -0,0 +1,126 @@
+from datetime import datetime
+
+import numpy as np
+import polars as pl
+import pytest
+from pytest import fixture
+
+import excellaint as ea
+
+
+@fixture
+def wide_df():
+    """
+    A frame with a few date columns in different formats hidden amongst some
+    columns that aren't dates at all - including prices in the range of Excel
+    serials, and version numbers shaped like dates.
+    """
+
+    stamps = pl.datetime_range(datetime(2020,1,1),datetime(2020,2,1),"1h",eager=True)
+
+    return stamps, pl.DataFrame(
+        {
+            "iso" : stamps.dt.strftime("%Y-%m-%dT%H:%M:%S"),
+            "label" : ["abc"] * len(stamps),
+            "dayfirst" : stamps.dt.strftime("%d/%m/%Y"),
+            "serial" : stamps.dt.epoch("s") / 86400 + 25569.0,
+            "reading" : [1.5] * len(stamps),
+            "price" : np.random.default_rng(0).integers(4 * 20000,4 * 70000,len(stamps)) / 4,
+            "version" : [f"{i % 3 + 1}.{i % 10}.{i % 7}" for i in range(len(stamps))],
+        }
+    )
+
+
+def test_find_date_columns(wide_df):
+    """
+    Check that the scanner finds the date columns, and only the date columns.
+    """
+
+    _, df = wide_df
+
+    found = ea.find_date_columns(df)
+
+    assert set(found["column"]) == {"iso","dayfirst","serial"}
+
+    formats = dict(zip(found["column"],found["format"]))
+    assert formats == {
+        "iso" : "%Y-%m-%dT%H:%M:%S",
+        "dayfirst" : "%d/%m/%Y",
+        "serial" : "excel_serial",
+    }
+
+
+def test_parse_columns(wide_df):
+    """
+    Check that we can parse every discovered column in one go, keeping the 
+    column names and order.
+    """
+
+    stamps, df = wide_df
+
+    parsed = ea.Parser().parse_columns(df)
+
+    assert parsed.columns == df.columns
+    assert parsed["iso"].equals(stamps.alias("iso"))
+    assert parsed["serial"].equals(stamps.alias("serial"))
+    assert parsed["dayfirst"].equals(stamps.dt.date().alias("dayfirst"))
+    assert parsed["label"].equals(df["label"])
+
+
+def test_parse_columns_clashing_names(wide_df):
+    """
+    A frame with columns named like the parser's outputs should still parse,
+    and in lenient mode every column should keep its own error codes. The 
+    format the scan inferred should be used rather than inferred again.
+    """
+
+    stamps, df = wide_df
+
+    df = pl.DataFrame(
+        {
+            "Datetime" : df["iso"],
+            "Date" : df["dayfirst"],
+            "bad" : df["dayfirst"].scatter(1,"01/99/2020"),
+        }
+    )
+
+    eap = ea.Parser(lenient=True)
+    parsed = eap.parse_columns(df)
+
+    assert parsed.columns == ["Datetime","Date","bad","Datetime_excellaint_error"
+                             ,"Date_excellaint_error","bad_excellaint_error"]
+    assert parsed["Datetime"].equals(stamps.alias("Datetime"))
+    assert parsed["Date"].equals(stamps.dt.date().alias("Date"))
+    assert parsed["bad"].null_count() == 1
+    assert parsed["bad_excellaint_error"][1] == ea.ParseError.MONTH_OUT_OF_RANGE
+    assert parsed["Date_excellaint_error"].sum() == 0
+    assert eap.last_run["Datetime"] == {"path" : "fast", "format" : "%Y-%m-%dT%H:%M:%S"}
+
+
+def test_parse_columns_skips_failures():
+    """
+    A column that can't be parsed should be left alone, with the reason 
+    recorded, rather than stopping the other columns from being parsed. 
+    Numbers in the range of Excel serials shouldn't be turned into dates.
+    """
+
+    df = pl.DataFrame(
+        {
+            "when" : ["01/02/2020","03/04/2021","05/06/2022"],
+            "ver" : ["1.2.3","1.4.5","2.0.1"],
+            "price" : [25000.5,31000.25,27500.0],
+            "odd" : ["01/02/2020","03/04/2020","05/06/20x0"],
+        }
+    )
+
+    eap = ea.Parser()
+
+    assert eap.parse_columns(df)["price"].equals(df["price"])
+
+    with pytest.warns(UserWarning,match="Could not parse `odd`"):
+        parsed = eap.parse_columns(df,columns=["when","odd"])
+
+    assert parsed["when"].cast(pl.Utf8).to_list() == ["2020-02-01","2021-04-03","2022-06-05"]
+    assert parsed["odd"].equals(df["odd"])
+    assert eap.last_run["odd"]["path"] == "skipped"
+    assert eap.last_run["when"]["path"] == "fast"
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+
+import polars as pl
+import pytest
+
+import excellaint as ea
+
+
+def test_generate_mangled():
+    """
+    Check that generation is seeded, that each mangling shows up, and that the
+    parser gets the truth back from the manglings it knows how to undo.
+    """
+
+    shares = dict(mdy_swap=0.1,two_digit_year=0.1,midnight_as_noon=0.5,dropped_time=0.5,serial=0.05,separator_noise=0.05)
+
+    df = ea.generate_mangled(10_000,seed=1,**shares)
+    assert df.equals(ea.generate_mangled(10_000,seed=1,**shares))
+    assert not df.equals(ea.generate_mangled(10_000,seed=2,**shares))
+    assert df["truth"].is_sorted()
+
+    mangled = df["mangled_dates"]
+    assert mangled.str.contains(r"^\d{2}/\d{2}/\d{2} ").any()
+    assert mangled.str.contains(r"^\d{2}/\d{2}/\d{4}$").any()
+    assert mangled.str.contains(r" 12:00$").sum() > df.height // 24
+    assert mangled.str.contains(r"^\d+\.\d+$").any()
+    assert mangled.str.contains(r"^\d{2}[-.]\d{2}[-.]\d{2,4}").any()
+
+    df = ea.generate_mangled(10_000,start=datetime(2001,1,1),frequency=timedelta(minutes=30),two_digit_year=0.3)
+    parsed = ea.Parser(mode="datetime")(df,"mangled_dates")
+    assert parsed["Datetime"].equals(parsed["truth"].alias("Datetime"))
+
+    with pytest.raises(ValueError):
+        ea.generate_mangled(10,serial=2.0)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet", ".xlsx"])
+def test_write_mangled(tmp_path, suffix):
+    if suffix == ".xlsx":
+        pytest.importorskip("xlsxwriter")
+
+    df = ea.generate_mangled(100,two_digit_year=0.5)
+    path = tmp_path / f"mangled{suffix}"
+
+    ea.write_mangled(df,path)
+
+    match suffix:
+        case ".csv":
+            written = pl.read_csv(path,try_parse_dates=True)
+        case ".parquet":
+            written = pl.read_parquet(path)
+        case ".xlsx":
+            written = pl.read_excel(path,engine="calamine")
+
+    assert written["mangled_dates"].equals(df["mangled_dates"])
@@ -0,0 +1,103 @@
+from datetime import datetime
+
+import polars as pl
+import pytest
+from pytest import fixture
+
+import excellaint as ea
+
+
+@fixture
+def workbook(tmp_path):
+    """
+    A workbook with three sheets of the same hourly, day first column.
+    """
+
+    xlsxwriter = pytest.importorskip("xlsxwriter")
+
+    stamps = pl.datetime_range(datetime(2020,1,1),datetime(2020,1,20),"1h",eager=True)
+    path = tmp_path / "multi.xlsx"
+
+    with xlsxwriter.Workbook(path) as wb:
+        for i in range(3):
+            sheet_stamps = stamps.dt.offset_by(f"{i}d")
+            pl.DataFrame(
+                {
+                    "dates" : sheet_stamps.dt.strftime("%d/%m/%Y %H:%M"),
+                    "value" : range(len(sheet_stamps)),
+                }
+            ).write_excel(wb,worksheet=f"S{i}")
+
+    return stamps, path
+
+
+def test_parse_workbook(workbook):
+    """
+    Check that every sheet is parsed, and that concatenating tags each row with
+    the sheet it came from.
+    """
+
+    stamps, path = workbook
+
+    parsed = ea.parse_workbook(path,"dates")
+    assert list(parsed) == ["S0","S1","S2"]
+    for i, (name, df) in enumerate(parsed.items()):
+        assert df["Datetime"].equals(stamps.dt.offset_by(f"{i}d").alias("Datetime"))
+
+    combined = ea.parse_workbook(path,"dates",sheets=["S0","S2"],concat=True)
+    assert combined.height == 2 * len(stamps)
+    assert combined["sheet"].unique(maintain_order=True).to_list() == ["S0","S2"]
+
+
+def test_parse_workbook_bad_sheet(workbook):
+    _, path = workbook
+
+    with pytest.raises(ValueError):
+        ea.parse_workbook(path,"dates",sheets=["Nope"])
+
+    with pytest.raises(ValueError):
+        ea.parse_workbook(path,"nope")
+
+
+def test_locked_format_falls_back():
+    """
+    A format locked in from a sample is only a guess, so a piece with a row the
+    sample missed should fall back on the component pipeline, not raise.
+    """
+
+    sample = pl.Series(["01/03/2020 12:00","02/03/2020 12:00","13/03/2020 12:00"])
+    locked = ea.Parser(mode="datetime").lock_format(sample)
+
+    assert locked.locked_format == "%d/%m/%Y %H:%M"
+    assert locked.date_format is None
+
+    df = pl.DataFrame({"dates" : ["01/03/2020 12:00","01/03/2020 12:00:30","13/03/2020 12:00"]})
+    parsed = locked(df,"dates",check_sorted=False)
+
+    assert locked.last_run["path"] == "generic"
+    assert parsed["Datetime"].to_list() == [
+        datetime(2020,3,1,12),
+        datetime(2020,3,1,12,0,30),
+        datetime(2020,3,13,12),
+    ]
+
+
+def test_parse_workbook_deviant_row(workbook, tmp_path):
+    """
+    One row in one sheet that the sample misses shouldn't sink the workbook.
+    """
+
+    xlsxwriter = pytest.importorskip("xlsxwriter")
+
+    stamps, _ = workbook
+    path = tmp_path / "deviant.xlsx"
+    strings = stamps.dt.strftime("%d/%m/%Y %H:%M")
+
+    with xlsxwriter.Workbook(path) as wb:
+        pl.DataFrame({"dates" : strings}).write_excel(wb,worksheet="S0")
+        pl.DataFrame({"dates" : strings.scatter(1,"01/01/2020 01:00:30")}).write_excel(wb,worksheet="S1")
+
+    parsed = ea.parse_workbook(path,"dates",sample_size=20)
+
+    assert parsed["S0"]["Datetime"].equals(stamps.alias("Datetime"))
+    assert parsed["S1"]["Datetime"].equals(stamps.scatter(1,datetime(2020,1,1,1,0,30)).alias("Datetime"))